@@ -8,7 +8,102 @@ import json
 import yaml
 from pathlib import Path
 from typing import Union
-from .model import SubsystemModel, Link, Joint, Motor, Sensor, JointType, MotorType
+from .model import (SubsystemModel, Link, Joint, Motor, Sensor, JointType, MotorType,
+                    COLLISION_PRIMITIVE_SIZES)
+
+
+# JSON Schema for config files, mirroring what load_config reads.
+# Used by the GUI's Validate button when jsonschema is installed.
+SUBSYSTEM_SCHEMA = {
+    "type": "object",
+    "required": ["name", "links", "joints", "motors", "sensors"],
+    "properties": {
+        "name": {"type": "string"},
+        "links": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["name", "mesh"],
+                "properties": {
+                    "name": {"type": "string"},
+                    "mesh": {"type": "string"},
+                    "mass": {"type": "number", "exclusiveMinimum": 0},
+                    "center_of_mass": {"type": "array", "items": {"type": "number"},
+                                       "minItems": 3, "maxItems": 3},
+                    "inertia": {
+                        "type": ["array", "null"],
+                        "items": {"type": "array", "items": {"type": "number"},
+                                  "minItems": 3, "maxItems": 3},
+                        "minItems": 3, "maxItems": 3
+                    },
+                    "collision_primitive": {
+                        "type": "array",
+                        "prefixItems": [
+                            {"enum": list(COLLISION_PRIMITIVE_SIZES)},
+                            {"type": "array", "items": {"type": "number"}}
+                        ],
+                        "minItems": 2, "maxItems": 2
+                    }
+                }
+            }
+        },
+        "joints": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["name", "type", "parent", "child"],
+                "properties": {
+                    "name": {"type": "string"},
+                    "type": {"enum": [t.value for t in JointType]},
+                    "parent": {"type": "string"},
+                    "child": {"type": "string"},
+                    "axis": {"type": "array", "items": {"type": "number"},
+                             "minItems": 3, "maxItems": 3},
+                    "origin": {"type": "array", "items": {"type": "number"},
+                               "minItems": 3, "maxItems": 3},
+                    "limits": {"type": ["array", "null"], "items": {"type": "number"},
+                               "minItems": 2, "maxItems": 2},
+                    "velocity_limit": {"type": "number"},
+                    "effort_limit": {"type": "number"}
+                }
+            }
+        },
+        "motors": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["name", "type", "joint"],
+                "properties": {
+                    "name": {"type": "string"},
+                    "type": {"enum": [t.value for t in MotorType]},
+                    "joint": {"type": "string"},
+                    "gear_ratio": {"type": "number"},
+                    "controller_type": {"type": "string"},
+                    "hal_port": {"type": "integer"},
+                    "inverted": {"type": "boolean"},
+                    "drum_radius": {"type": "number"}
+                }
+            }
+        },
+        "sensors": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["name", "joint"],
+                "properties": {
+                    "name": {"type": "string"},
+                    "type": {"type": "string"},
+                    "joint": {"type": "string"},
+                    "controller_type": {"type": "string"},
+                    "hal_ports": {"type": "array", "items": {"type": "integer"}},
+                    "can_id": {"type": ["integer", "null"]},
+                    "ticks_per_rev": {"type": "integer"},
+                    "offset": {"type": "number"}
+                }
+            }
+        }
+    }
+}
 
 
 def load_config(config_path: Union[str, Path]) -> SubsystemModel:
@@ -31,7 +126,7 @@ def load_config(config_path: Union[str, Path]) -> SubsystemModel:
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
     # Load file
-    with open(config_path, 'r') as f:
+    with open(config_path, 'r', encoding='utf-8') as f:
         if config_path.suffix == '.json':
             data = json.load(f)
         elif config_path.suffix in ['.yaml', '.yml']:
@@ -58,12 +153,27 @@ def load_config(config_path: Union[str, Path]) -> SubsystemModel:
         else:
             mesh_path_resolved = mesh_path_obj.absolute()
 
+        # Optional primitive collision shape: ["box", [x, y, z]]
+        primitive_data = link_data.get('collision_primitive')
+        collision_primitive = None
+        if primitive_data is not None:
+            if (not isinstance(primitive_data, list) or len(primitive_data) != 2
+                    or not isinstance(primitive_data[0], str)
+                    or not isinstance(primitive_data[1], list)
+                    or not all(isinstance(v, (int, float)) and not isinstance(v, bool) and v > 0
+                               for v in primitive_data[1])):
+                raise ValueError(
+                    f"Invalid configuration:\n  Link '{link_data.get('name')}': collision_primitive "
+                    f"must be [shape, [positive sizes...]], got {primitive_data!r}")
+            collision_primitive = (primitive_data[0], tuple(primitive_data[1]))
+
         link = Link(
             name=link_data['name'],
             mesh_path=str(mesh_path_resolved),
             mass=link_data.get('mass', 1.0),
             center_of_mass=tuple(link_data.get('center_of_mass', [0, 0, 0])),
-            inertia=link_data.get('inertia', None)
+            inertia=link_data.get('inertia', None),
+            collision_primitive=collision_primitive
         )
         links.append(link)
 
@@ -135,6 +245,21 @@ def load_config(config_path: Union[str, Path]) -> SubsystemModel:
     return model
 
 
+def _link_to_dict(link: Link) -> dict:
+    """Convert a Link to its config JSON form (collision_primitive only when set)."""
+    data = {
+        'name': link.name,
+        'mesh': link.mesh_path,
+        'mass': link.mass,
+        'center_of_mass': list(link.center_of_mass),
+        'inertia': link.inertia
+    }
+    if link.collision_primitive is not None:
+        shape, size = link.collision_primitive
+        data['collision_primitive'] = [shape, list(size)]
+    return data
+
+
 def save_config(model: SubsystemModel, config_path: Union[str, Path]):
     """
     Save subsystem configuration to JSON file.
@@ -148,16 +273,7 @@ def save_config(model: SubsystemModel, config_path: Union[str, Path]):
     # Convert model to dictionary
     data = {
         'name': model.name,
-        'links': [
-            {
-                'name': link.name,
-                'mesh': link.mesh_path,
-                'mass': link.mass,
-                'center_of_mass': list(link.center_of_mass),
-                'inertia': link.inertia
-            }
-            for link in model.links
-        ],
+        'links': [_link_to_dict(link) for link in model.links],
         'joints': [
             {
                 'name': joint.name,
@@ -33,6 +33,10 @@ class MotorType(Enum):
     VENOM = "venom"
 
 
+# Collision primitive shape -> number of size values (see Link.collision_primitive)
+COLLISION_PRIMITIVE_SIZES = {"box": 3, "sphere": 1, "cylinder": 2}
+
+
 @dataclass
 class Link:
     """
@@ -44,12 +48,17 @@ class Link:
         mass: Mass in kilograms
         center_of_mass: (x, y, z) offset of COM from link origin
         inertia: 3x3 inertia tensor (or None to use default)
+        collision_primitive: Optional simple collision shape used instead of the
+            mesh, much cheaper for PyBullet: ("box", (x, y, z)),
+            ("sphere", (radius,)) or ("cylinder", (radius, length)).
+            None collides with the mesh itself.
     """
     name: str
     mesh_path: str
     mass: float = 1.0
     center_of_mass: Tuple[float, float, float] = (0.0, 0.0, 0.0)
     inertia: Optional[List[List[float]]] = None  # 3x3 matrix
+    collision_primitive: Optional[Tuple[str, Tuple[float, ...]]] = None
 
     def __post_init__(self):
         """Generate default inertia if not provided."""
@@ -216,6 +225,19 @@ class SubsystemModel:
         if len(link_names) != len(set(link_names)):
             errors.append("Duplicate link names found")
 
+        # Check collision primitives have a known shape and the right number of positive sizes
+        for link in self.links:
+            if link.collision_primitive is not None:
+                shape, size = link.collision_primitive
+                expected = COLLISION_PRIMITIVE_SIZES.get(shape)
+                if expected is None:
+                    errors.append(f"Link '{link.name}' has unknown collision primitive '{shape}'")
+                elif len(size) != expected:
+                    errors.append(f"Link '{link.name}' {shape} collision needs {expected} size value(s)")
+                elif not all(isinstance(v, (int, float)) and not isinstance(v, bool) and v > 0
+                             for v in size):
+                    errors.append(f"Link '{link.name}' {shape} collision sizes must be positive numbers")
+
         # Check that all joints reference valid links
         for joint in self.joints:
             if joint.parent_link not in link_names:
@@ -4,18 +4,33 @@ Run this INSTEAD of the normal bridge to see all WebSocket traffic.
 """
 
 import asyncio
+import sys
 import websockets
 import json
 from collections import defaultdict
 
+# orjson is optional: parses much faster than the stdlib on a busy HAL Sim stream
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 class WSDiagnostic:
+    # Max distinct raw frames remembered for the parse-skip cache
+    FRAME_CACHE_SIZE = 4096
+    # Largest per-type live log quota below; later messages of a type are only counted
+    LOG_CAP = 100
+
     def __init__(self, ws_uri: str = "ws://localhost:3300/wpilibws"):
         self.ws_uri = ws_uri
         self.message_types = defaultdict(int)
         self.device_types = defaultdict(set)  # type -> set of device names
-        self.device_fields = defaultdict(set)  # device_name -> set of field names
-        self.can_devices = {}  # device_name -> latest data
+        self.device_fields = defaultdict(set)  # (type, device_name) -> set of field names
+        self.can_devices = {}  # device_name -> latest non-init data
         self.total_messages = 0
+        # raw frame -> (type, device, data, non-init data); HAL Sim resends many identical frames
+        self._frame_cache = {}
 
     async def run(self):
         print(f"Connecting to {self.ws_uri}...")
@@ -23,7 +38,8 @@ class WSDiagnostic:
         print("Press Ctrl+C to stop and see summary\n")
 
         try:
-            async with websockets.connect(self.ws_uri) as ws:
+            # max_queue=None: never pause reading, so the log reflects the full stream
+            async with websockets.connect(self.ws_uri, max_queue=None) as ws:
                 print("[OK] Connected!\n")
                 print("="*70)
                 print("LIVE MESSAGE LOG (first 100 of each type)")
@@ -31,86 +47,101 @@ class WSDiagnostic:
 
                 type_counts = defaultdict(int)
 
-                while True:
-                    try:
-                        msg = await asyncio.wait_for(ws.recv(), timeout=0.1)
-                        self.total_messages += 1
-
-                        data = json.loads(msg)
+                # Iterate frames as they arrive: no per-message timeout timer or task
+                async for msg in ws:
+                    self.total_messages += 1
+
+                    # A frame identical to one already parsed carries nothing new
+                    # (same type, device and fields), so skip the JSON parse for it
+                    cached = self._frame_cache.get(msg)
+                    if cached is not None:
+                        msg_type, device, msg_data, live_data = cached
+                    else:
+                        data = _json_loads(msg)
                         msg_type = data.get("type", "unknown")
                         device = data.get("device", "")
                         msg_data = data.get("data", {})
+                        # Only non-init fields are kept for the CAN/SimDevice summary
+                        live_data = {k: v for k, v in msg_data.items() if not k.startswith("<init")}
 
-                        self.message_types[msg_type] += 1
                         self.device_types[msg_type].add(device)
-
-                        key = f"{msg_type}:{device}"
-                        for field in msg_data.keys():
-                            self.device_fields[key].add(field)
-
-                        type_counts[msg_type] += 1
-
-                        # Log SimDevice messages in detail (motors are here)
-                        if msg_type == "SimDevice":
-                            self.can_devices[device] = msg_data
-                            # Always print SimDevice messages (limited)
-                            if type_counts[msg_type] <= 100:
-                                print(f"[SimDevice] {device}")
-                                print(f"    Fields: {list(msg_data.keys())}")
-                                # Print non-init fields
-                                for k, v in msg_data.items():
-                                    if not k.startswith("<init") and v != 0:
-                                        print(f"    {k}: {v}")
-                                print()
-
-                        # Log PWM messages
-                        elif msg_type == "PWM" and type_counts[msg_type] <= 50:
-                            print(f"[PWM] device={device}, data={msg_data}")
-
-                        # Log other potentially interesting types
-                        elif msg_type not in ["DriverStation", "RoboRIO", "Joystick"] and type_counts[msg_type] <= 20:
-                            print(f"[{msg_type}] device={device}, data={msg_data}")
-
-                    except asyncio.TimeoutError:
-                        pass
+                        self.device_fields[(msg_type, device)].update(msg_data.keys())
+
+                        if len(self._frame_cache) < self.FRAME_CACHE_SIZE:
+                            self._frame_cache[msg] = (msg_type, device, msg_data, live_data)
+
+                    self.message_types[msg_type] += 1
+                    if msg_type == "SimDevice":
+                        self.can_devices[device] = live_data
+
+                    # Devices and fields are learned above; once a type is past its
+                    # log quota there is nothing left to do for it
+                    if self.message_types[msg_type] > self.LOG_CAP:
+                        continue
+
+                    type_counts[msg_type] += 1
+
+                    # Log SimDevice messages in detail (motors are here)
+                    if msg_type == "SimDevice":
+                        # Always print SimDevice messages (limited)
+                        if type_counts[msg_type] <= 100:
+                            print(f"[SimDevice] {device}")
+                            print(f"    Fields: {list(msg_data.keys())}")
+                            # Print non-init fields
+                            for k, v in msg_data.items():
+                                if not k.startswith("<init") and v != 0:
+                                    print(f"    {k}: {v}")
+                            print()
+
+                    # Log PWM messages
+                    elif msg_type == "PWM" and type_counts[msg_type] <= 50:
+                        print(f"[PWM] device={device}, data={msg_data}")
+
+                    # Log other potentially interesting types
+                    elif msg_type not in ["DriverStation", "RoboRIO", "Joystick"] and type_counts[msg_type] <= 20:
+                        print(f"[{msg_type}] device={device}, data={msg_data}")
 
         except KeyboardInterrupt:
             pass
         except Exception as e:
             print(f"Error: {e}")
 
-        print("\n\n" + "="*70)
-        print("DIAGNOSTIC SUMMARY")
-        print("="*70)
+        # Build the summary as one string: a busy capture has thousands of lines
+        lines = ["\n\n" + "="*70, "DIAGNOSTIC SUMMARY", "="*70]
 
-        print(f"\nTotal messages received: {self.total_messages}")
+        lines.append(f"\nTotal messages received: {self.total_messages}")
 
-        print("\n--- Message Types ---")
+        lines.append("\n--- Message Types ---")
         for msg_type, count in sorted(self.message_types.items(), key=lambda x: -x[1]):
-            print(f"  {msg_type}: {count} messages")
+            lines.append(f"  {msg_type}: {count} messages")
 
-        print("\n--- Devices by Type ---")
+        lines.append("\n--- Devices by Type ---")
         for msg_type, devices in sorted(self.device_types.items()):
-            print(f"\n  {msg_type}:")
+            lines.append(f"\n  {msg_type}:")
             for device in sorted(devices):
-                key = f"{msg_type}:{device}"
-                fields = self.device_fields.get(key, set())
-                print(f"    - {device or '(empty)'}")
+                fields = self.device_fields.get((msg_type, device), set())
+                lines.append(f"    - {device or '(empty)'}")
                 if fields:
-                    print(f"      Fields: {sorted(fields)}")
+                    lines.append(f"      Fields: {sorted(fields)}")
 
-        print("\n--- CAN/SimDevice Details ---")
+        lines.append("\n--- CAN/SimDevice Details ---")
         for device, data in sorted(self.can_devices.items()):
-            print(f"\n  {device}:")
+            lines.append(f"\n  {device}:")
             for k, v in sorted(data.items()):
-                print(f"    {k}: {v}")
+                lines.append(f"    {k}: {v}")
 
-        print("\n" + "="*70)
-        print("Use this info to update websocket_bridge.py to match actual field names")
-        print("="*70)
+        lines.append("\n" + "="*70)
+        lines.append("Use this info to update websocket_bridge.py to match actual field names")
+        lines.append("="*70)
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
-    import sys
     uri = sys.argv[1] if len(sys.argv) > 1 else "ws://localhost:3300/wpilibws"
-    asyncio.run(WSDiagnostic(uri).run())
+    # uvloop (optional, not available on Windows) keeps up better with a saturated stream
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(WSDiagnostic(uri).run())
+    else:
+        uvloop.run(WSDiagnostic(uri).run())
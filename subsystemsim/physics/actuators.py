@@ -6,9 +6,18 @@ Uses the DC motor equation: V = IR + Kv*w to calculate torque from voltage and s
 """
 
 import math
+from functools import lru_cache
 from typing import Dict
 from enum import Enum
 
+import numpy as np
+
+
+# Unit conversions (bound once instead of recomputing 2*pi/60 at each use)
+_TWO_PI = 2.0 * math.pi
+_RAD_PER_RPM = _TWO_PI / 60.0
+_RPM_PER_RAD = 60.0 / _TWO_PI
+
 
 # Motor specifications database
 # Source: FRC motor spec sheets (free speed, stall torque, stall current)
@@ -70,6 +79,86 @@ MOTOR_SPECS = {
 }
 
 
+def _motor_torques_numpy(voltages, motor_velocities, gear_ratios, Kv, Kt, R,
+                         stall_current, efficiency):
+    """
+    Output torque for several motors at once (same math as DCMotor.calculate_torque).
+
+    Voltages must already be clamped to +/-NOMINAL_VOLTAGE.
+
+    Args:
+        voltages: Applied voltage per motor (float64 array)
+        motor_velocities: Motor shaft speed per motor in rad/s (output speed * gear ratio)
+        gear_ratios, Kv, Kt, R, stall_current: Per-motor constants (float64 arrays)
+        efficiency: Gearbox efficiency (scalar)
+
+    Returns:
+        Output torque per motor in Nm
+    """
+    currents = np.clip((voltages - motor_velocities / Kv) / R, -stall_current, stall_current)
+    return Kt * currents * gear_ratios * efficiency
+
+
+# Numba is optional: when installed, motor_torques is a compiled loop with the
+# same signature; otherwise it is the NumPy version above.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is None:
+    motor_torques = _motor_torques_numpy
+else:
+    @njit(cache=True)
+    def motor_torques(voltages, motor_velocities, gear_ratios, Kv, Kt, R,
+                      stall_current, efficiency):
+        """Numba-compiled version of _motor_torques_numpy."""
+        out = np.empty_like(voltages)
+        for i in range(voltages.shape[0]):
+            current = (voltages[i] - motor_velocities[i] / Kv[i]) / R[i]
+            current = min(stall_current[i], max(-stall_current[i], current))
+            out[i] = Kt[i] * current * gear_ratios[i] * efficiency
+        return out
+
+
+def _torque_kernel(voltage, angular_velocity, gear_ratio, Kv, Kt, R,
+                   stall_current, efficiency, nominal_voltage):
+    """Scalar DC motor torque; see DCMotor.calculate_torque for the equations."""
+    # Clamp voltage to realistic range
+    voltage = max(-nominal_voltage, min(nominal_voltage, voltage))
+
+    # Convert output velocity to motor velocity
+    motor_velocity = angular_velocity * gear_ratio
+
+    # Calculate back-EMF
+    back_emf = motor_velocity / Kv  # emf = Kv * w, rearranged
+
+    # Calculate current
+    current = (voltage - back_emf) / R
+
+    # Clamp current to prevent unrealistic values
+    current = max(-stall_current, min(stall_current, current))
+
+    # Motor torque, then gear ratio and efficiency
+    return Kt * current * gear_ratio * efficiency
+
+
+if njit is not None:
+    _torque_kernel = njit(cache=True)(_torque_kernel)
+
+
+@lru_cache(maxsize=256)
+def _max_torque(stall_torque_nm: float, gear_ratio: float, efficiency: float) -> float:
+    """Stall torque at the output shaft; cached since only a few gear ratios are used."""
+    return stall_torque_nm * gear_ratio * efficiency
+
+
+@lru_cache(maxsize=256)
+def _max_speed(free_speed_rad_s: float, gear_ratio: float) -> float:
+    """Free speed at the output shaft; cached like _max_torque."""
+    return free_speed_rad_s / gear_ratio
+
+
 class DCMotor:
     """
     Physics-based DC motor model.
@@ -88,16 +177,21 @@ class DCMotor:
     - Kt: Torque constant (Nm per amp)
     """
 
+    # Fixed attribute set: no per-instance __dict__, cheaper self.Kv/Kt/R reads
+    __slots__ = ('motor_type', 'type_index', 'free_speed_rpm', 'stall_torque_nm',
+                 'stall_current_a', 'free_current_a', 'free_speed_rad_s', 'Kv', 'Kt', 'R')
+
     # Constants
     NOMINAL_VOLTAGE = 12.0  # FRC standard voltage
     GEARBOX_EFFICIENCY = 0.8  # Typical gearbox efficiency (80%)
 
-    def __init__(self, motor_type: str):
+    def __init__(self, motor_type: str, verbose: bool = False):
         """
         Initialize motor from specs database.
 
         Args:
             motor_type: Motor type string (e.g., 'neo', 'cim', 'falcon500')
+            verbose: If True, print the derived motor constants
         """
         if motor_type not in MOTOR_SPECS:
             raise ValueError(f"Unknown motor type: {motor_type}. "
@@ -105,6 +199,7 @@ class DCMotor:
 
         specs = MOTOR_SPECS[motor_type]
         self.motor_type = motor_type
+        self.type_index = MOTOR_TYPE_INDEX[motor_type]  # Row in MOTOR_TABLE
 
         # Store raw specs
         self.free_speed_rpm = specs['free_speed_rpm']
@@ -114,7 +209,7 @@ class DCMotor:
 
         # Calculate motor constants
         # Kv = w_free / V  (rad/s per volt)
-        self.free_speed_rad_s = (self.free_speed_rpm * 2 * math.pi) / 60.0
+        self.free_speed_rad_s = self.free_speed_rpm * _RAD_PER_RPM
         self.Kv = self.free_speed_rad_s / self.NOMINAL_VOLTAGE
 
         # Kt = T_stall / I_stall  (Nm per amp)
@@ -123,8 +218,9 @@ class DCMotor:
         # R = V / I_stall  (ohms)
         self.R = self.NOMINAL_VOLTAGE / self.stall_current_a
 
-        print(f"Initialized {motor_type}: "
-              f"Kv={self.Kv:.3f} rad/s/V, Kt={self.Kt:.4f} Nm/A, R={self.R:.4f} Ohm")
+        if verbose:
+            print(f"Initialized {motor_type}: "
+                  f"Kv={self.Kv:.3f} rad/s/V, Kt={self.Kt:.4f} Nm/A, R={self.R:.4f} Ohm")
 
     def calculate_torque(self, voltage: float, angular_velocity: float,
                         gear_ratio: float = 1.0) -> float:
@@ -145,28 +241,33 @@ class DCMotor:
         Returns:
             Output torque in Nm
         """
-        # Clamp voltage to realistic range
-        voltage = max(-self.NOMINAL_VOLTAGE, min(self.NOMINAL_VOLTAGE, voltage))
-
-        # Convert output velocity to motor velocity
-        motor_velocity = angular_velocity * gear_ratio
-
-        # Calculate back-EMF
-        back_emf = motor_velocity / self.Kv  # emf = Kv * w, rearranged
-
-        # Calculate current
-        current = (voltage - back_emf) / self.R
-
-        # Clamp current to prevent unrealistic values
-        current = max(-self.stall_current_a, min(self.stall_current_a, current))
+        return _torque_kernel(
+            voltage, angular_velocity, gear_ratio,
+            self.Kv, self.Kt, self.R, self.stall_current_a,
+            self.GEARBOX_EFFICIENCY, self.NOMINAL_VOLTAGE
+        )
+
+    def calculate_torque_batch(self, voltages: np.ndarray, angular_velocities: np.ndarray,
+                               gear_ratios=1.0) -> np.ndarray:
+        """
+        Vectorized calculate_torque() for many operating points of this motor type.
 
-        # Calculate motor torque
-        motor_torque = self.Kt * current
+        Same equations and clamping as calculate_torque(), evaluated as NumPy
+        elementwise operations instead of one Python call per point.
 
-        # Apply gear ratio and efficiency
-        output_torque = motor_torque * gear_ratio * self.GEARBOX_EFFICIENCY
+        Args:
+            voltages: Applied voltages in volts (array)
+            angular_velocities: Output shaft angular velocities in rad/s (array)
+            gear_ratios: Gear reduction ratio(s), scalar or array
 
-        return output_torque
+        Returns:
+            Output torques in Nm (array)
+        """
+        voltages = np.clip(voltages, -self.NOMINAL_VOLTAGE, self.NOMINAL_VOLTAGE)
+        motor_velocities = np.asarray(angular_velocities, dtype=np.float64) * gear_ratios
+        currents = np.clip((voltages - motor_velocities / self.Kv) / self.R,
+                           -self.stall_current_a, self.stall_current_a)
+        return self.Kt * currents * gear_ratios * self.GEARBOX_EFFICIENCY
 
     def calculate_torque_simple(self, voltage: float, gear_ratio: float = 1.0) -> float:
         """
@@ -196,7 +297,7 @@ class DCMotor:
         Returns:
             Maximum torque in Nm
         """
-        return self.stall_torque_nm * gear_ratio * self.GEARBOX_EFFICIENCY
+        return _max_torque(self.stall_torque_nm, gear_ratio, self.GEARBOX_EFFICIENCY)
 
     def get_max_speed(self, gear_ratio: float = 1.0) -> float:
         """
@@ -208,7 +309,7 @@ class DCMotor:
         Returns:
             Maximum speed in rad/s (of output shaft)
         """
-        return self.free_speed_rad_s / gear_ratio
+        return _max_speed(self.free_speed_rad_s, gear_ratio)
 
     def __str__(self) -> str:
         return (f"DCMotor({self.motor_type}: "
@@ -216,6 +317,23 @@ class DCMotor:
                 f"{self.stall_torque_nm:.2f} Nm stall)")
 
 
+# Derived constants per motor type as one structured array (one row per type,
+# same formulas as DCMotor.__init__), so batch code can gather the constants for
+# many motors with a single indexed load: MOTOR_TABLE['Kv'][type_indices]
+MOTOR_TYPE_INDEX: Dict[str, int] = {name: i for i, name in enumerate(MOTOR_SPECS)}
+MOTOR_TABLE = np.zeros(len(MOTOR_SPECS), dtype=[
+    ('Kv', 'f8'), ('Kt', 'f8'), ('R', 'f8'), ('stall_current', 'f8')
+])
+for _name, _specs in MOTOR_SPECS.items():
+    MOTOR_TABLE[MOTOR_TYPE_INDEX[_name]] = (
+        _specs['free_speed_rpm'] * _RAD_PER_RPM / DCMotor.NOMINAL_VOLTAGE,
+        _specs['stall_torque_nm'] / _specs['stall_current_a'],
+        DCMotor.NOMINAL_VOLTAGE / _specs['stall_current_a'],
+        _specs['stall_current_a'],
+    )
+del _name, _specs
+
+
 # Convenience function to create motor from string
 def create_motor(motor_type: str) -> DCMotor:
     """Factory function to create a DC motor."""
@@ -227,7 +345,7 @@ if __name__ == "__main__":
     print("=== Testing Motor Models ===\n")
 
     # Create a NEO motor
-    neo = DCMotor('neo')
+    neo = DCMotor('neo', verbose=True)
     print(f"\n{neo}\n")
 
     # Test torque calculation at different speeds
@@ -247,7 +365,7 @@ if __name__ == "__main__":
 
     print(f"\nMax torque: {neo.get_max_torque(gear_ratio):.2f} Nm")
     print(f"Max speed: {neo.get_max_speed(gear_ratio):.2f} rad/s "
-          f"({neo.get_max_speed(gear_ratio) * 60 / (2*math.pi):.1f} RPM)")
+          f"({neo.get_max_speed(gear_ratio) * _RPM_PER_RAD:.1f} RPM)")
 
     # Compare different motors
     print("\n\n=== Motor Comparison (at stall with 60:1 gearing) ===\n")
@@ -255,9 +373,9 @@ if __name__ == "__main__":
     print("-" * 52)
 
     for motor_name in ['neo', 'cim', 'falcon500', 'neo550']:
-        motor = DCMotor(motor_name)
+        motor = DCMotor(motor_name, verbose=True)
         max_torque = motor.get_max_torque(60)
-        max_rpm = motor.get_max_speed(60) * 60 / (2 * math.pi)
+        max_rpm = motor.get_max_speed(60) * _RPM_PER_RAD
         print(f"{motor_name:<12} {max_torque:<20.2f} {max_rpm:<20.1f}")
 
     print("\n[OK] Motor models working correctly!")
@@ -5,8 +5,71 @@ Handles initialization, URDF loading, and simulation stepping.
 
 import pybullet as p
 import pybullet_data
+from pybullet_utils import bullet_client
 import numpy as np
-from typing import Tuple, Optional
+import math
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple, Optional
+
+
+_PI = math.pi
+_TWO_PI = 2.0 * math.pi
+
+
+def _normalize_revolute(position: float) -> float:
+    """Wrap a revolute joint angle to the (-pi, pi] range."""
+    position = ((position + _PI) % _TWO_PI) - _PI
+    if position <= -_PI:
+        position += _TWO_PI
+    return position
+
+
+def _normalize_revolute_array_numpy(positions: np.ndarray) -> np.ndarray:
+    """Vectorized _normalize_revolute(); wraps every angle to (-pi, pi] in place."""
+    np.add(positions, _PI, out=positions)
+    np.mod(positions, _TWO_PI, out=positions)
+    np.subtract(positions, _PI, out=positions)
+    return np.where(positions <= -_PI, positions + _TWO_PI, positions)
+
+
+# Numba is optional: when installed, _normalize_revolute_array is a compiled
+# single-pass loop; otherwise it is the NumPy version above.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is None:
+    _normalize_revolute_array = _normalize_revolute_array_numpy
+else:
+    @njit(cache=True)
+    def _normalize_revolute_array(positions):
+        """Numba-compiled version of _normalize_revolute_array_numpy."""
+        for i in range(positions.shape[0]):
+            position = ((positions[i] + _PI) % _TWO_PI) - _PI
+            if position <= -_PI:
+                position += _TWO_PI
+            positions[i] = position
+        return positions
+
+
+class JointHandle:
+    """
+    A joint with its body, index, type and axis resolved up front.
+
+    Get one from PhysicsEngine.get_joint_handle() during setup, then use
+    get_handle_state()/apply_handle_torque() in loops that run every step.
+    """
+
+    __slots__ = ('body_id', 'joint_index', 'axis', 'joint_type', 'link_index')
+
+    def __init__(self, body_id: int, joint_index: int, axis: Tuple[float, float, float],
+                 joint_type: int):
+        self.body_id = body_id
+        self.joint_index = joint_index
+        self.axis = axis
+        self.joint_type = joint_type  # 0 = revolute, 1 = prismatic
+        self.link_index = joint_index  # PyBullet's child link index equals the joint index
 
 
 class PhysicsEngine:
@@ -16,18 +79,32 @@ class PhysicsEngine:
     GRAVITY = -9.81  # m/s^2 (Z-up convention)
     TIMESTEP = 1.0 / 240.0  # 240 Hz simulation (PyBullet default)
 
-    def __init__(self, gui: bool = True):
+    def __init__(self, gui: bool = True, fuse_substeps: bool = False,
+                 num_solver_iterations: Optional[int] = None,
+                 solver_residual_threshold: Optional[float] = None,
+                 load_plane: bool = True):
         """
         Initialize PyBullet physics engine.
 
         Args:
             gui: If True, use GUI mode. If False, use DIRECT mode (headless).
+            fuse_substeps: If True, step(n) runs all n steps inside one
+                stepSimulation() call (PyBullet numSubSteps). Note that applied
+                joint torques then act for every substep instead of only the first.
+            num_solver_iterations: Constraint solver iterations per step
+                (None keeps PyBullet's default of 50). Fewer is faster but
+                joints and limits get softer.
+            solver_residual_threshold: Stop iterating early once the solver
+                residual drops below this (None keeps PyBullet's default)
+            load_plane: If False, skip the ground plane (plane_id is None). Bases
+                are fixed, so only free bodies ever touch it.
         """
-        # Connect to PyBullet
+        # Connect to PyBullet through a BulletClient so every call is bound to this
+        # engine's own physics server (several engines can run in one process)
         if gui:
-            self.physics_client = p.connect(p.GUI)
+            self._p = bullet_client.BulletClient(connection_mode=p.GUI)
             # Configure camera for better viewing (zoomed out for larger mechanisms)
-            p.resetDebugVisualizerCamera(
+            self._p.resetDebugVisualizerCamera(
                 cameraDistance=1.5,
                 cameraYaw=45,
                 cameraPitch=-30,
@@ -35,35 +112,81 @@ class PhysicsEngine:
             )
             # Disable unnecessary debug visualizer features for performance
             # These features can accumulate data and cause progressive lag
-            p.configureDebugVisualizer(p.COV_ENABLE_GUI, 0)  # Disable side panel GUI
-            p.configureDebugVisualizer(p.COV_ENABLE_SHADOWS, 0)  # Disable shadows
-            p.configureDebugVisualizer(p.COV_ENABLE_WIREFRAME, 0)  # Disable wireframe
-            p.configureDebugVisualizer(p.COV_ENABLE_RENDERING, 1)  # Keep rendering on
-            p.configureDebugVisualizer(p.COV_ENABLE_TINY_RENDERER, 0)  # Disable CPU renderer
-            p.configureDebugVisualizer(p.COV_ENABLE_RGB_BUFFER_PREVIEW, 0)  # Disable RGB preview
-            p.configureDebugVisualizer(p.COV_ENABLE_DEPTH_BUFFER_PREVIEW, 0)  # Disable depth preview
-            p.configureDebugVisualizer(p.COV_ENABLE_SEGMENTATION_MARK_PREVIEW, 0)  # Disable segmentation
+            self._p.configureDebugVisualizer(p.COV_ENABLE_GUI, 0)  # Disable side panel GUI
+            self._p.configureDebugVisualizer(p.COV_ENABLE_SHADOWS, 0)  # Disable shadows
+            self._p.configureDebugVisualizer(p.COV_ENABLE_WIREFRAME, 0)  # Disable wireframe
+            self._p.configureDebugVisualizer(p.COV_ENABLE_RENDERING, 1)  # Keep rendering on
+            self._p.configureDebugVisualizer(p.COV_ENABLE_TINY_RENDERER, 0)  # Disable CPU renderer
+            self._p.configureDebugVisualizer(p.COV_ENABLE_RGB_BUFFER_PREVIEW, 0)  # Disable RGB preview
+            self._p.configureDebugVisualizer(p.COV_ENABLE_DEPTH_BUFFER_PREVIEW, 0)  # Disable depth preview
+            self._p.configureDebugVisualizer(p.COV_ENABLE_SEGMENTATION_MARK_PREVIEW, 0)  # Disable segmentation
         else:
-            self.physics_client = p.connect(p.DIRECT)
+            self._p = bullet_client.BulletClient(connection_mode=p.DIRECT)
+        self.physics_client = self._p._client
+        # BulletClient builds a bound partial on every attribute lookup, so keep
+        # the ones used each physics tick
+        self._get_joint_states = self._p.getJointStates
+        self._apply_external_force = self._p.applyExternalForce
+        self._apply_external_torque = self._p.applyExternalTorque
+        self._step_simulation = self._p.stepSimulation
+        self._connected = True
+        self.fuse_substeps = fuse_substeps
+        self._sub_steps = 1  # numSubSteps currently configured in PyBullet
 
         # Set gravity (Z-up convention)
-        p.setGravity(0, 0, self.GRAVITY)
+        self._p.setGravity(0, 0, self.GRAVITY)
+
+        # Pin the step size to TIMESTEP (the fused step() path changes it) and keep
+        # broadphase pair order deterministic so headless runs are reproducible
+        self._p.setPhysicsEngineParameter(fixedTimeStep=self.TIMESTEP,
+                                          deterministicOverlappingPairs=1)
+
+        # Optional solver tuning; only override what was asked for
+        solver_params = {}
+        if num_solver_iterations is not None:
+            solver_params['numSolverIterations'] = num_solver_iterations
+        if solver_residual_threshold is not None:
+            solver_params['solverResidualThreshold'] = solver_residual_threshold
+        if solver_params:
+            self._p.setPhysicsEngineParameter(**solver_params)
 
         # Add search path for default URDFs
-        p.setAdditionalSearchPath(pybullet_data.getDataPath())
+        self._p.setAdditionalSearchPath(pybullet_data.getDataPath())
 
         # Load ground plane
-        self.plane_id = p.loadURDF("plane.urdf")
+        self.plane_id = self._p.loadURDF("plane.urdf") if load_plane else None
 
         # Store loaded bodies
         self.bodies = {}  # name -> body_id mapping
         self.joint_indices = {}  # name -> joint_index mapping
+        self.joint_types = {}  # name -> PyBullet joint type (0 = revolute, 1 = prismatic)
+        # body_id -> per-joint arrays indexed by joint index, built once in load_urdf:
+        # {'indices': [0..n-1], 'type': int8, 'axis': (n, 3) float64, 'revolute': bool}
+        self._joint_tables = {}
+        # Joint state only changes when the sim steps: get_joint_state reads a whole
+        # body once per tick into body_id -> (tick, positions, velocities)
+        self._tick = 0
+        self._state_cache = {}
+        # (mesh_path, rgba) -> (collision_shape, visual_shape); bodies can share shapes
+        self._shape_cache = {}
 
         print(f"PhysicsEngine initialized (GUI={gui})")
 
+    @property
+    def client(self) -> bullet_client.BulletClient:
+        """
+        The BulletClient bound to this engine's physics server.
+
+        Use it for raw PyBullet calls (createMultiBody, ...) so they reach this
+        engine rather than PyBullet's default client.
+        """
+        return self._p
+
     def load_urdf(self, urdf_path: str, name: str = "robot",
                    base_position: Tuple[float, float, float] = (0, 0, 0),
-                   base_orientation: Optional[Tuple[float, float, float, float]] = None) -> int:
+                   base_orientation: Optional[Tuple[float, float, float, float]] = None,
+                   verbose: bool = False, enable_ft_sensors: bool = False,
+                   fixed_base: bool = True) -> int:
         """
         Load a URDF file into the simulation.
 
@@ -72,6 +195,11 @@ class PhysicsEngine:
             name: Name to identify this body
             base_position: (x, y, z) position of the robot base
             base_orientation: Quaternion (x, y, z, w) or None for default (0, 0, 0, 1)
+            verbose: If True, print each joint as it is set up
+            enable_ft_sensors: If True, enable the force/torque sensor on every
+                joint (reaction forces in getJointState()[2]). Off by default
+                since Bullet computes them every step; see also enable_ft().
+            fixed_base: If True (default), fix the base link to the world
 
         Returns:
             PyBullet body ID
@@ -79,56 +207,95 @@ class PhysicsEngine:
         if base_orientation is None:
             base_orientation = [0, 0, 0, 1]  # No rotation
 
-        body_id = p.loadURDF(
+        body_id = self._p.loadURDF(
             urdf_path,
             basePosition=base_position,
             baseOrientation=base_orientation,
-            useFixedBase=True  # Fix base to ground (for now)
+            useFixedBase=fixed_base
         )
 
         self.bodies[name] = body_id
 
         # Get joint information and enable dynamics
-        num_joints = p.getNumJoints(body_id)
+        num_joints = self._p.getNumJoints(body_id)
         
         # Also disable damping on the base link
-        p.changeDynamics(body_id, -1, linearDamping=0.0, angularDamping=0.0, jointDamping=0.0)
+        self._p.changeDynamics(body_id, -1, linearDamping=0.0, angularDamping=0.0, jointDamping=0.0)
         
+        # Joint type and axis never change, so hot paths read them from these tables
+        joint_type = np.empty(num_joints, dtype=np.int8)  # 0 = revolute, 1 = prismatic
+        joint_axis = np.empty((num_joints, 3), dtype=np.float64)
+
         for i in range(num_joints):
-            joint_info = p.getJointInfo(body_id, i)
+            joint_info = self._p.getJointInfo(body_id, i)
             joint_name = joint_info[1].decode('utf-8')
             self.joint_indices[joint_name] = i
-            print(f"  Joint {i}: {joint_name} (type={joint_info[2]})")
-
-            # Reset joint to zero position
-            p.resetJointState(body_id, i, targetValue=0.0, targetVelocity=0.0)
+            self.joint_types[joint_name] = joint_info[2]
+            joint_type[i] = joint_info[2]
+            joint_axis[i] = joint_info[13]
+            if verbose:
+                print(f"  Joint {i}: {joint_name} (type={joint_info[2]})")
 
             # Note: Joint damping is now primarily set in the URDF <dynamics> element
             # This provides more realistic motor behavior (velocity-proportional resistance).
             # The URDF damping value takes precedence over changeDynamics if specified.
             # We keep linearDamping and angularDamping at 0 so only joint damping applies.
-            p.changeDynamics(
+            self._p.changeDynamics(
                 body_id, i,
                 linearDamping=0.0,
                 angularDamping=0.0
             )
 
-            # Disable motor by setting velocity control with zero force
+            # Joint force/torque sensor (for stress monitoring); only when requested
+            if enable_ft_sensors:
+                self._p.enableJointForceTorqueSensor(body_id, i, enableSensor=True)
+
+        joint_list = list(range(num_joints))
+        zeros = [0.0] * num_joints
+
+        if num_joints:
+            # Reset all joints to zero position
+            if hasattr(p, 'resetJointStatesMultiDof'):
+                self._p.resetJointStatesMultiDof(body_id, joint_list,
+                                                 targetValues=[[0.0]] * num_joints,
+                                                 targetVelocities=[[0.0]] * num_joints)
+            else:
+                for i in joint_list:
+                    self._p.resetJointState(body_id, i, targetValue=0.0, targetVelocity=0.0)
+
+            # Disable motors by setting velocity control with zero force
             # This prevents PyBullet's default motor from interfering
-            p.setJointMotorControl2(
+            self._p.setJointMotorControlArray(
                 bodyUniqueId=body_id,
-                jointIndex=i,
+                jointIndices=joint_list,
                 controlMode=p.VELOCITY_CONTROL,
-                targetVelocity=0,
-                force=0
+                targetVelocities=zeros,
+                forces=zeros
             )
 
-            # Enable joint force/torque sensor (for stress monitoring later)
-            p.enableJointForceTorqueSensor(body_id, i, enableSensor=True)
+        self._tick += 1  # Joints were just reset
+        self._joint_tables[body_id] = {
+            'indices': joint_list,
+            'type': joint_type,
+            'axis': joint_axis,
+            'revolute': joint_type == 0
+        }
 
         print(f"Loaded URDF: {name} (body_id={body_id}, {num_joints} joints)")
         return body_id
 
+    def enable_ft(self, body_name: str, joint_name: str, enable: bool = True):
+        """
+        Turn the force/torque sensor on or off for one joint.
+
+        Args:
+            body_name: Name of the body
+            joint_name: Name of the joint
+            enable: True to report reaction forces for this joint
+        """
+        self._p.enableJointForceTorqueSensor(self.bodies[body_name], self.joint_indices[joint_name],
+                                             enableSensor=enable)
+
     def load_mesh(self, mesh_path: str, name: str = "mesh",
                    position: Tuple[float, float, float] = (0, 0, 1),
                    mass: float = 1.0) -> int:
@@ -144,21 +311,29 @@ class PhysicsEngine:
         Returns:
             PyBullet body ID
         """
-        # Create collision shape from mesh
-        collision_shape = p.createCollisionShape(
-            shapeType=p.GEOM_MESH,
-            fileName=mesh_path
-        )
+        rgba = (0.7, 0.7, 0.7, 1.0)  # Gray color
+
+        # Reuse the shapes if this mesh was loaded before (skips re-parsing the OBJ)
+        shape_key = (mesh_path, rgba)
+        shapes = self._shape_cache.get(shape_key)
+        if shapes is None:
+            # Create collision shape from mesh
+            collision_shape = self._p.createCollisionShape(
+                shapeType=p.GEOM_MESH,
+                fileName=mesh_path
+            )
 
-        # Create visual shape from same mesh
-        visual_shape = p.createVisualShape(
-            shapeType=p.GEOM_MESH,
-            fileName=mesh_path,
-            rgbaColor=[0.7, 0.7, 0.7, 1.0]  # Gray color
-        )
+            # Create visual shape from same mesh
+            visual_shape = self._p.createVisualShape(
+                shapeType=p.GEOM_MESH,
+                fileName=mesh_path,
+                rgbaColor=list(rgba)
+            )
+            shapes = self._shape_cache[shape_key] = (collision_shape, visual_shape)
+        collision_shape, visual_shape = shapes
 
         # Create multi-body
-        body_id = p.createMultiBody(
+        body_id = self._p.createMultiBody(
             baseMass=mass,
             baseCollisionShapeIndex=collision_shape,
             baseVisualShapeIndex=visual_shape,
@@ -187,23 +362,85 @@ class PhysicsEngine:
         body_id = self.bodies[body_name]
         joint_index = self.joint_indices[joint_name]
 
-        joint_state = p.getJointState(body_id, joint_index)
-        position = joint_state[0]  # Joint position
-        velocity = joint_state[1]  # Joint velocity
+        # Repeat queries within a tick (controller, logger, ...) reuse one
+        # getJointStates read of every joint on the body
+        cached = self._state_cache.get(body_id)
+        if cached is None or cached[0] != self._tick:
+            # Revolute positions come back already normalized to (-pi, pi]
+            positions, velocities = self.snapshot_joints(body_name)
+            cached = self._state_cache[body_id] = (
+                self._tick, positions.tolist(), velocities.tolist()
+            )
+
+        return cached[1][joint_index], cached[2][joint_index]
 
-        # Get joint info to check if it's revolute (rotational)
-        joint_info = p.getJointInfo(body_id, joint_index)
-        joint_type = joint_info[2]  # Joint type
-        
-        # For revolute joints (type 0), normalize position to (-pi, pi]
-        if joint_type == 0:  # REVOLUTE
-            import math
-            # Normalize to (-pi, pi]
-            position = ((position + math.pi) % (2 * math.pi)) - math.pi
-            if position == -math.pi:
-                position = math.pi
+    def get_all_joint_states(self, body_name: str,
+                             joint_names: List[str]) -> Dict[str, Tuple[float, float]]:
+        """
+        Get the state of several joints with a single PyBullet call.
+
+        Args:
+            body_name: Name of the body
+            joint_names: Names of the joints to query
+
+        Returns:
+            Dict of {joint_name: (position, velocity)}, with revolute positions
+            normalized to (-pi, pi] exactly like get_joint_state()
+        """
+        joint_indices = [self.joint_indices[name] for name in joint_names]
+        return dict(zip(joint_names, self.get_joint_states_by_index(body_name, joint_indices)))
+
+    def get_joint_states_by_index(self, body_name: str,
+                                  joint_indices: List[int]) -> List[Tuple[float, float]]:
+        """
+        Get the state of several joints by PyBullet joint index.
 
-        return position, velocity
+        Lets callers resolve joint names once (via self.joint_indices) instead of
+        on every query.
+
+        Args:
+            body_name: Name of the body
+            joint_indices: PyBullet joint indices to query
+
+        Returns:
+            List of (position, velocity) in the same order as joint_indices, with
+            revolute positions normalized to (-pi, pi]
+        """
+        body_id = self.bodies[body_name]
+        joint_states = self._get_joint_states(body_id, joint_indices)
+        joint_type = self._joint_tables[body_id]['type']
+
+        states = []
+        for joint_index, joint_state in zip(joint_indices, joint_states):
+            position = joint_state[0]
+            if joint_type[joint_index] == 0:  # REVOLUTE
+                position = _normalize_revolute(position)
+            states.append((position, joint_state[1]))
+        return states
+
+    def snapshot_joints(self, body_name: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Read every joint of a URDF body with a single PyBullet call.
+
+        Args:
+            body_name: Name of a body loaded with load_urdf()
+
+        Returns:
+            Tuple of (positions, velocities) arrays indexed by PyBullet joint
+            index, with revolute positions normalized to (-pi, pi]
+        """
+        body_id = self.bodies[body_name]
+        table = self._joint_tables[body_id]
+        joint_indices = table['indices']
+        revolute = table['revolute']
+        joint_states = self._get_joint_states(body_id, joint_indices)
+
+        count = len(joint_indices)
+        positions = np.fromiter((state[0] for state in joint_states), dtype=np.float64, count=count)
+        velocities = np.fromiter((state[1] for state in joint_states), dtype=np.float64, count=count)
+        if revolute.any():
+            positions[revolute] = _normalize_revolute_array(positions[revolute])
+        return positions, velocities
 
     def apply_joint_torque(self, body_name: str, joint_name: str, torque: float):
         """
@@ -217,49 +454,109 @@ class PhysicsEngine:
             joint_name: Name of the joint
             torque: Torque in Nm (revolute) or force in N (prismatic)
         """
+        self.apply_joint_torques_by_index(body_name, [self.joint_indices[joint_name]], [torque])
+
+    def apply_joint_torques(self, body_name: str, joint_names: List[str], torques: List[float]):
+        """
+        Apply torques/forces to several joints in one call.
+
+        Same behavior as apply_joint_torque() for each (joint_name, torque) pair.
+
+        Args:
+            body_name: Name of the body
+            joint_names: Names of the joints
+            torques: Torque in Nm (revolute) or force in N (prismatic), per joint
+        """
+        joint_indices = [self.joint_indices[name] for name in joint_names]
+        self.apply_joint_torques_by_index(body_name, joint_indices, torques)
+
+    def apply_joint_torques_by_index(self, body_name: str, joint_indices: List[int],
+                                     torques: List[float]):
+        """
+        Apply torques/forces to several joints by PyBullet joint index.
+
+        Args:
+            body_name: Name of the body
+            joint_indices: PyBullet joint indices
+            torques: Torque in Nm (revolute) or force in N (prismatic), per joint
+        """
+        body_id = self.bodies[body_name]
+        table = self._joint_tables[body_id]
+        joint_type = table['type']
+        joint_axis = table['axis']
+
+        # All axis * torque vectors in one NumPy multiply
+        vectors = joint_axis[joint_indices] * np.asarray(torques, dtype=np.float64)[:, None]
+
+        # A joint's child link index equals its joint index in PyBullet
+        for joint_index, vector in zip(joint_indices, vectors.tolist()):
+            if joint_type[joint_index] == 1:  # PRISMATIC joint - apply force along the joint axis
+                # Apply force at link center (LINK_FRAME avoids getLinkState call)
+                self._apply_external_force(
+                    objectUniqueId=body_id,
+                    linkIndex=joint_index,
+                    forceObj=vector,
+                    posObj=[0, 0, 0],
+                    flags=p.LINK_FRAME
+                )
+            else:  # REVOLUTE joint - apply torque
+                self._apply_external_torque(
+                    objectUniqueId=body_id,
+                    linkIndex=joint_index,
+                    torqueObj=vector,
+                    flags=p.WORLD_FRAME
+                )
+
+    def get_joint_handle(self, body_name: str, joint_name: str) -> JointHandle:
+        """
+        Resolve a joint once so per-step calls skip the name lookups.
+
+        Args:
+            body_name: Name of a body loaded with load_urdf()
+            joint_name: Name of the joint
+
+        Returns:
+            JointHandle for get_handle_state() and apply_handle_torque()
+        """
         body_id = self.bodies[body_name]
         joint_index = self.joint_indices[joint_name]
+        table = self._joint_tables[body_id]
+        return JointHandle(body_id, joint_index,
+                           tuple(table['axis'][joint_index].tolist()),
+                           int(table['type'][joint_index]))
 
-        # Use cached joint info for performance (joint properties don't change)
-        cache_key = (body_id, joint_index)
-        if not hasattr(self, '_joint_cache'):
-            self._joint_cache = {}
-
-        if cache_key not in self._joint_cache:
-            joint_info = p.getJointInfo(body_id, joint_index)
-            self._joint_cache[cache_key] = {
-                'type': joint_info[2],  # 0 = revolute, 1 = prismatic
-                'axis': joint_info[13],
-                'link_index': joint_index
-            }
-
-        cached = self._joint_cache[cache_key]
-        joint_type = cached['type']
-        axis = cached['axis']
-        link_index = cached['link_index']
-
-        if joint_type == 1:  # PRISMATIC joint - apply force
-            # For prismatic joints, apply force along the joint axis
-            force_vector = [axis[0] * torque, axis[1] * torque, axis[2] * torque]
-
-            # Apply force at link center (LINK_FRAME avoids getLinkState call)
-            p.applyExternalForce(
-                objectUniqueId=body_id,
-                linkIndex=link_index,
-                forceObj=force_vector,
-                posObj=[0, 0, 0],
-                flags=p.LINK_FRAME
-            )
-        else:  # REVOLUTE joint - apply torque
-            # Calculate torque vector in world frame
-            torque_vector = [axis[0] * torque, axis[1] * torque, axis[2] * torque]
-
-            p.applyExternalTorque(
-                objectUniqueId=body_id,
-                linkIndex=link_index,
-                torqueObj=torque_vector,
-                flags=p.WORLD_FRAME
-            )
+    def get_handle_state(self, handle: JointHandle) -> Tuple[float, float]:
+        """
+        Same as get_joint_state(), for a pre-resolved joint.
+
+        Args:
+            handle: JointHandle from get_joint_handle()
+
+        Returns:
+            Tuple of (position, velocity), revolute positions normalized to (-pi, pi]
+        """
+        joint_state = self._p.getJointState(handle.body_id, handle.joint_index)
+        position = joint_state[0]
+        if handle.joint_type == 0:  # REVOLUTE
+            position = _normalize_revolute(position)
+        return position, joint_state[1]
+
+    def apply_handle_torque(self, handle: JointHandle, torque: float):
+        """
+        Same as apply_joint_torque(), for a pre-resolved joint.
+
+        Args:
+            handle: JointHandle from get_joint_handle()
+            torque: Torque in Nm (revolute) or force in N (prismatic)
+        """
+        axis = handle.axis
+        vector = [axis[0] * torque, axis[1] * torque, axis[2] * torque]
+        if handle.joint_type == 1:  # PRISMATIC
+            self._apply_external_force(handle.body_id, handle.link_index, vector,
+                                       [0, 0, 0], p.LINK_FRAME)
+        else:  # REVOLUTE
+            self._apply_external_torque(handle.body_id, handle.link_index, vector,
+                                        p.WORLD_FRAME)
 
     def step(self, num_steps: int = 1):
         """
@@ -268,24 +565,124 @@ class PhysicsEngine:
         Args:
             num_steps: Number of simulation steps (each is TIMESTEP seconds)
         """
+        self._tick += 1  # Invalidates get_joint_state's per-tick cache
+
+        if not self.fuse_substeps:
+            step_simulation = self._step_simulation
+            for _ in range(num_steps):
+                step_simulation()
+            return
+
+        # One stepSimulation() of num_steps * TIMESTEP split into num_steps substeps;
+        # only reconfigure when the count changes (it's usually the same every tick)
+        if num_steps != self._sub_steps:
+            self._p.setPhysicsEngineParameter(fixedTimeStep=num_steps * self.TIMESTEP,
+                                              numSubSteps=num_steps)
+            self._sub_steps = num_steps
+        self._step_simulation()
+
+    def run_steps(self, body_name: str, num_steps: int, joint_indices: List[int],
+                  torques: List[float]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Hold joint torques for num_steps steps and return the resulting state.
+
+        Meant for headless (DIRECT) runs that drive the sim without the HAL
+        bridge: one call replaces a Python-level apply/step/read cycle. PyBullet
+        clears external forces after every stepSimulation(), so the torques are
+        re-applied before each step and act for the whole interval.
+
+        Args:
+            body_name: Name of a body loaded with load_urdf()
+            num_steps: Number of simulation steps (each is TIMESTEP seconds)
+            joint_indices: PyBullet joint indices to drive
+            torques: Torque in Nm (revolute) or force in N (prismatic), per joint
+
+        Returns:
+            (positions, velocities) from snapshot_joints() after the last step
+        """
+        self._tick += 1  # Invalidates get_joint_state's per-tick cache
+        # Each stepSimulation() here must be one TIMESTEP, so undo a fused step() size
+        if self._sub_steps != 1:
+            self._p.setPhysicsEngineParameter(fixedTimeStep=self.TIMESTEP, numSubSteps=1)
+            self._sub_steps = 1
         for _ in range(num_steps):
-            p.stepSimulation()
+            self.apply_joint_torques_by_index(body_name, joint_indices, torques)
+            self._step_simulation()
+        return self.snapshot_joints(body_name)
 
     def disconnect(self):
-        """Disconnect from PyBullet."""
-        p.disconnect()
+        """Disconnect from PyBullet. Safe to call more than once."""
+        if not self._connected:
+            return
+        self._connected = False
+        self._p.disconnect()
         print("PhysicsEngine disconnected")
 
 
+class MultiPhysicsEngine:
+    """
+    Several independent headless PhysicsEngines stepped together.
+
+    Each environment is its own DIRECT BulletClient, so bodies, joint tables
+    and state caches never mix between environments.
+    """
+
+    def __init__(self, num_envs: int, max_workers: Optional[int] = None, **engine_kwargs):
+        """
+        Create num_envs headless engines.
+
+        Args:
+            num_envs: Number of environments
+            max_workers: If > 1, step_all() steps environments on a thread pool
+                of this size. This only runs in parallel when the PyBullet build
+                releases the GIL during stepSimulation; by default (None)
+                environments are stepped one after another.
+            **engine_kwargs: Passed to every PhysicsEngine (e.g. num_solver_iterations)
+        """
+        self.envs = [PhysicsEngine(gui=False, **engine_kwargs) for _ in range(num_envs)]
+        self._executor = None
+        if max_workers is not None and max_workers > 1:
+            self._executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def __len__(self) -> int:
+        return len(self.envs)
+
+    def __getitem__(self, index: int) -> PhysicsEngine:
+        return self.envs[index]
+
+    def step_all(self, num_steps: int = 1):
+        """
+        Step every environment forward.
+
+        Args:
+            num_steps: Number of simulation steps per environment
+        """
+        if self._executor is None:
+            for env in self.envs:
+                env.step(num_steps)
+            return
+
+        # list() waits for every environment and re-raises the first error
+        list(self._executor.map(lambda env: env.step(num_steps), self.envs))
+
+    def disconnect(self):
+        """Disconnect every environment and stop the thread pool. Safe to call more than once."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        for env in self.envs:
+            env.disconnect()
+
+
 if __name__ == "__main__":
     # Basic test
     engine = PhysicsEngine(gui=True)
 
     # Load a simple shape
     import time
-    collision_shape = p.createCollisionShape(p.GEOM_BOX, halfExtents=[0.1, 0.1, 0.1])
-    visual_shape = p.createVisualShape(p.GEOM_BOX, halfExtents=[0.1, 0.1, 0.1], rgbaColor=[1, 0, 0, 1])
-    cube_id = p.createMultiBody(baseMass=1, baseCollisionShapeIndex=collision_shape,
+    collision_shape = engine._p.createCollisionShape(p.GEOM_BOX, halfExtents=[0.1, 0.1, 0.1])
+    visual_shape = engine._p.createVisualShape(p.GEOM_BOX, halfExtents=[0.1, 0.1, 0.1], rgbaColor=[1, 0, 0, 1])
+    cube_id = engine._p.createMultiBody(baseMass=1, baseCollisionShapeIndex=collision_shape,
                                   baseVisualShapeIndex=visual_shape, basePosition=[0, 0, 1])
 
     print("Simulating falling cube (press Ctrl+C to stop)...")
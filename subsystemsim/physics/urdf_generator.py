@@ -5,13 +5,20 @@ Converts SubsystemModel to URDF XML format that PyBullet can load.
 URDF (Unified Robot Description Format) is the standard format for robot kinematics.
 """
 
+import hashlib
+import json
 import os
+from dataclasses import asdict
+from enum import Enum
 from pathlib import Path
 from typing import List
-import xml.etree.ElementTree as ET
-import xml.dom.minidom as minidom
+from xml.sax.saxutils import quoteattr
 from ..core.model import SubsystemModel, Link, Joint, JointType
 
+# Bump whenever the generated XML changes (_link_xml/_joint_xml/_primitive_xml),
+# so URDFs cached by an older generator are rebuilt instead of reused
+_URDF_FORMAT_VERSION = 1
+
 
 def generate_urdf(model: SubsystemModel, output_dir: str = None,
                   joint_damping: float = 0.5, joint_friction: float = 0.0,
@@ -49,29 +56,53 @@ def generate_urdf(model: SubsystemModel, output_dir: str = None,
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Create URDF XML tree
-    robot = ET.Element("robot", name=model.name)
-
     # Calculate URDF path first (needed for relative paths)
     urdf_path = output_dir / f"{model.name}.urdf"
 
-    # Add all links (pass urdf_path for relative path calculation)
-    for link in model.links:
-        robot.append(_create_link_element(link, urdf_path))
-
-    # Add all joints with appropriate damping for joint type
-    for joint in model.joints:
-        # Use higher damping for prismatic joints to prevent oscillation
-        if joint.joint_type == JointType.PRISMATIC:
-            damping = prismatic_damping
-        else:
-            damping = joint_damping
-        robot.append(_create_joint_element(joint, damping=damping, friction=joint_friction))
-
-    # Convert to pretty XML string
-    xml_string = _prettify_xml(robot)
-    with open(urdf_path, 'w') as f:
-        f.write(xml_string)
+    # Resolve each distinct mesh path once; links often share a mesh directory
+    urdf_dir = urdf_path.parent.absolute()
+    mesh_paths = {path: _mesh_path_for_urdf(path, urdf_dir)
+                  for path in {link.mesh_path for link in model.links}}
+
+    # Skip regeneration if nothing that goes into the file changed since last time
+    hash_input = json.dumps(
+        [_URDF_FORMAT_VERSION, model.name,
+         [asdict(link) for link in model.links], [asdict(joint) for joint in model.joints],
+         sorted(mesh_paths.items()), joint_damping, joint_friction, prismatic_damping],
+        sort_keys=True, default=_json_default
+    )
+    model_hash = hashlib.blake2b(hash_input.encode(), digest_size=16).hexdigest()
+    hash_path = urdf_path.with_name(urdf_path.name + ".hash")
+    if urdf_path.exists() and hash_path.exists() and hash_path.read_text() == model_hash:
+        print(f"URDF unchanged, reusing: {urdf_path}")
+        return str(urdf_path.absolute())
+
+    # Drop the stale hash first and write to a temp file, so a failed write can
+    # never leave a truncated URDF that the next run would reuse
+    hash_path.unlink(missing_ok=True)
+    tmp_path = urdf_path.with_name(urdf_path.name + ".tmp")
+
+    # URDF is write-once, so stream each element's text straight to the file
+    # instead of building an XML tree and serializing it
+    with open(tmp_path, 'w') as f:
+        f.write(f'<?xml version="1.0"?>\n<robot name={quoteattr(model.name)}>\n')
+
+        # Add all links (mesh paths are relative to the URDF file)
+        for link in model.links:
+            f.write(_link_xml(link, mesh_paths[link.mesh_path]))
+
+        # Add all joints with appropriate damping for joint type
+        for joint in model.joints:
+            # Use higher damping for prismatic joints to prevent oscillation
+            if joint.joint_type == JointType.PRISMATIC:
+                damping = prismatic_damping
+            else:
+                damping = joint_damping
+            f.write(_joint_xml(joint, damping=damping, friction=joint_friction))
+
+        f.write('</robot>\n')
+    os.replace(tmp_path, urdf_path)
+    hash_path.write_text(model_hash)
 
     print(f"Generated URDF: {urdf_path}")
     print(f"  Revolute joint damping: {joint_damping} Nm/(rad/s)")
@@ -79,72 +110,127 @@ def generate_urdf(model: SubsystemModel, output_dir: str = None,
     return str(urdf_path.absolute())
 
 
-def _create_link_element(link: Link, urdf_path: Path) -> ET.Element:
-    """
-    Create a URDF <link> element from Link object.
+def _json_default(value):
+    """Encode model values json can't handle natively (enums) for the URDF cache key."""
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Cannot hash {type(value).__name__} for URDF cache key")
 
-    URDF link structure:
-    <link name="...">
-      <visual><geometry><mesh filename="..."/></geometry></visual>
-      <collision><geometry><mesh filename="..."/></geometry></collision>
-      <inertial><mass value="..."/><inertia .../></inertial>
-    </link>
+
+def _mesh_path_for_urdf(mesh_path: str, urdf_dir: Path) -> str:
     """
-    link_elem = ET.Element("link", name=link.name)
+    Get the mesh filename to write into the URDF.
 
-    # Calculate relative path from URDF directory to mesh file
-    # This avoids issues with PyBullet prepending working directory on Windows
-    import os
-    mesh_abs_path = Path(link.mesh_path).absolute()
-    urdf_dir = urdf_path.parent.absolute()
+    Relative to the URDF directory, which avoids issues with PyBullet
+    prepending the working directory on Windows.
+
+    Args:
+        mesh_path: Mesh path from the Link
+        urdf_dir: Absolute directory the URDF is written to
 
+    Returns:
+        Mesh path with forward slashes
+    """
+    mesh_abs_path = Path(mesh_path).absolute()
     try:
         # Use os.path.relpath for proper relative path calculation
         mesh_rel_path = os.path.relpath(mesh_abs_path, urdf_dir)
-        mesh_path_str = mesh_rel_path.replace('\\', '/')
+        return mesh_rel_path.replace('\\', '/')
     except ValueError:
         # If relative path fails (different drives on Windows), use absolute with forward slashes
-        mesh_path_str = str(mesh_abs_path).replace('\\', '/')
+        return str(mesh_abs_path).replace('\\', '/')
 
-    # Visual geometry
-    visual = ET.SubElement(link_elem, "visual")
-    visual_geom = ET.SubElement(visual, "geometry")
-    ET.SubElement(visual_geom, "mesh", filename=mesh_path_str)
 
-    # Collision geometry (same as visual for simplicity)
-    collision = ET.SubElement(link_elem, "collision")
-    collision_geom = ET.SubElement(collision, "geometry")
-    ET.SubElement(collision_geom, "mesh", filename=mesh_path_str)
+def _link_xml(link: Link, mesh_path_str: str) -> str:
+    """
+    Format a URDF <link> element from Link object.
 
-    # Inertial properties
-    inertial = ET.SubElement(link_elem, "inertial")
+    URDF link structure:
+    <link name="...">
+      <visual><geometry><mesh filename="..."/></geometry></visual>
+      <collision><geometry><mesh filename="..."/></geometry></collision>
+      <inertial><mass value="..."/><inertia .../></inertial>
+    </link>
 
-    # Origin (center of mass offset)
-    com_xyz = " ".join(map(str, link.center_of_mass))
-    ET.SubElement(inertial, "origin", xyz=com_xyz, rpy="0 0 0")
+    Args:
+        link: Link object from model
+        mesh_path_str: Mesh filename as written in the URDF
+
+    Returns:
+        Indented XML text for the link, ending in a newline
+    """
+    mesh = quoteattr(mesh_path_str)
 
-    # Mass
-    ET.SubElement(inertial, "mass", value=str(link.mass))
+    # Numbers use .9g: shorter and faster to format than str(float), and far
+    # more precision than mass/inertia/geometry values carry
+
+    # Origin (center of mass offset)
+    com = link.center_of_mass
 
     # Inertia tensor (3x3 matrix)
     # URDF format: ixx, ixy, ixz, iyy, iyz, izz
-    inertia_matrix = link.inertia
-    ET.SubElement(
-        inertial, "inertia",
-        ixx=str(inertia_matrix[0][0]),
-        ixy=str(inertia_matrix[0][1]),
-        ixz=str(inertia_matrix[0][2]),
-        iyy=str(inertia_matrix[1][1]),
-        iyz=str(inertia_matrix[1][2]),
-        izz=str(inertia_matrix[2][2])
+    m = link.inertia
+
+    # Collision geometry: a primitive if the link has one (far cheaper for
+    # Bullet's narrow phase), otherwise the same mesh as the visual
+    if link.collision_primitive is not None:
+        collision_geom = _primitive_xml(*link.collision_primitive)
+    else:
+        collision_geom = f'<mesh filename={mesh} />'
+
+    return (
+        f'  <link name={quoteattr(link.name)}>\n'
+        f'    <visual>\n'
+        f'      <geometry>\n'
+        f'        <mesh filename={mesh} />\n'
+        f'      </geometry>\n'
+        f'    </visual>\n'
+        f'    <collision>\n'
+        f'      <geometry>\n'
+        f'        {collision_geom}\n'
+        f'      </geometry>\n'
+        f'    </collision>\n'
+        f'    <inertial>\n'
+        f'      <origin xyz="{com[0]:.9g} {com[1]:.9g} {com[2]:.9g}" rpy="0 0 0" />\n'
+        f'      <mass value="{link.mass:.9g}" />\n'
+        f'      <inertia ixx="{m[0][0]:.9g}" ixy="{m[0][1]:.9g}" ixz="{m[0][2]:.9g}" '
+        f'iyy="{m[1][1]:.9g}" iyz="{m[1][2]:.9g}" izz="{m[2][2]:.9g}" />\n'
+        f'    </inertial>\n'
+        f'  </link>\n'
     )
 
-    return link_elem
 
+def _primitive_xml(shape: str, size) -> str:
+    """
+    Format a URDF primitive geometry element.
+
+    Args:
+        shape: "box", "sphere" or "cylinder"
+        size: (x, y, z) for box, (radius,) for sphere, (radius, length) for cylinder
 
-def _create_joint_element(joint: Joint, damping: float = 0.5, friction: float = 0.0) -> ET.Element:
+    Returns:
+        Geometry element text, e.g. '<box size="0.1 0.2 0.3" />'
     """
-    Create a URDF <joint> element from Joint object.
+    if shape == "box":
+        return f'<box size="{size[0]:.9g} {size[1]:.9g} {size[2]:.9g}" />'
+    if shape == "sphere":
+        return f'<sphere radius="{size[0]:.9g}" />'
+    if shape == "cylinder":
+        return f'<cylinder radius="{size[0]:.9g}" length="{size[1]:.9g}" />'
+    raise ValueError(f"Unknown collision primitive: {shape}")
+
+
+# Map our JointType enum to URDF type strings
+_URDF_JOINT_TYPES = {
+    JointType.REVOLUTE: "revolute",
+    JointType.PRISMATIC: "prismatic",
+    JointType.FIXED: "fixed"
+}
+
+
+def _joint_xml(joint: Joint, damping: float = 0.5, friction: float = 0.0) -> str:
+    """
+    Format a URDF <joint> element from Joint object.
 
     URDF joint structure:
     <joint name="..." type="...">
@@ -164,76 +250,46 @@ def _create_joint_element(joint: Joint, damping: float = 0.5, friction: float =
                  Typical values: 0.1-1.0 for small joints, 1.0-5.0 for large joints.
         friction: Coulomb friction coefficient (constant resistance to motion)
                   Set to 0 for smooth motor-driven joints.
-    """
-    # Map our JointType enum to URDF type strings
-    joint_type_map = {
-        JointType.REVOLUTE: "revolute",
-        JointType.PRISMATIC: "prismatic",
-        JointType.FIXED: "fixed"
-    }
-    urdf_type = joint_type_map[joint.joint_type]
 
-    joint_elem = ET.Element("joint", name=joint.name, type=urdf_type)
-
-    # Parent and child links
-    ET.SubElement(joint_elem, "parent", link=joint.parent_link)
-    ET.SubElement(joint_elem, "child", link=joint.child_link)
+    Returns:
+        Indented XML text for the joint, ending in a newline
+    """
+    urdf_type = _URDF_JOINT_TYPES[joint.joint_type]
 
-    # Joint origin (position in parent frame)
-    origin_xyz = " ".join(map(str, joint.origin))
-    ET.SubElement(joint_elem, "origin", xyz=origin_xyz, rpy="0 0 0")
+    # Parent and child links, then joint origin (position in parent frame)
+    origin = joint.origin
+    parts = [
+        f'  <joint name={quoteattr(joint.name)} type="{urdf_type}">\n'
+        f'    <parent link={quoteattr(joint.parent_link)} />\n'
+        f'    <child link={quoteattr(joint.child_link)} />\n'
+        f'    <origin xyz="{origin[0]:.9g} {origin[1]:.9g} {origin[2]:.9g}" rpy="0 0 0" />\n'
+    ]
 
     # Joint axis (for revolute/prismatic joints)
     if joint.joint_type != JointType.FIXED:
-        axis_xyz = " ".join(map(str, joint.axis))
-        ET.SubElement(joint_elem, "axis", xyz=axis_xyz)
+        axis = joint.axis
 
         # Joint limits (only if joint is limited)
         # Unlimited joints (limits=None) allow continuous rotation
         if joint.limits is not None:
-            ET.SubElement(
-                joint_elem, "limit",
-                lower=str(joint.limits[0]),
-                upper=str(joint.limits[1]),
-                velocity=str(joint.velocity_limit),
-                effort=str(joint.effort_limit)
-            )
+            lower, upper = joint.limits
         else:
             # For unlimited joints, still need a limit element in URDF
             # but we use very large values that won't be reached in practice
-            ET.SubElement(
-                joint_elem, "limit",
-                lower=str(-1e6),
-                upper=str(1e6),
-                velocity=str(joint.velocity_limit),
-                effort=str(joint.effort_limit)
-            )
+            lower, upper = -1e6, 1e6
 
         # Add dynamics element for realistic motor behavior
         # damping: creates velocity-proportional resistance (like motor back-EMF)
         # friction: constant resistance to motion (like static friction)
-        ET.SubElement(
-            joint_elem, "dynamics",
-            damping=str(damping),
-            friction=str(friction)
+        parts.append(
+            f'    <axis xyz="{axis[0]:.9g} {axis[1]:.9g} {axis[2]:.9g}" />\n'
+            f'    <limit lower="{lower:.9g}" upper="{upper:.9g}" '
+            f'velocity="{joint.velocity_limit:.9g}" effort="{joint.effort_limit:.9g}" />\n'
+            f'    <dynamics damping="{damping:.9g}" friction="{friction:.9g}" />\n'
         )
 
-    return joint_elem
-
-
-def _prettify_xml(elem: ET.Element) -> str:
-    """
-    Convert XML element to pretty-printed string.
-
-    Args:
-        elem: Root XML element
-
-    Returns:
-        Pretty-printed XML string
-    """
-    rough_string = ET.tostring(elem, encoding='unicode')
-    reparsed = minidom.parseString(rough_string)
-    return reparsed.toprettyxml(indent="  ")
+    parts.append('  </joint>\n')
+    return "".join(parts)
 
 
 if __name__ == "__main__":
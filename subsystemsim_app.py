@@ -13,18 +13,338 @@ Features:
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
+import codecs
+import contextlib
+import copy
+import functools
+from collections import OrderedDict, deque
 import json
+import operator
+import queue
 import threading
-import subprocess
 import sys
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import TYPE_CHECKING, Optional, Dict, List, Set, Tuple
 import os
 
+if TYPE_CHECKING:
+    import subprocess
+    from jsonschema import Draft202012Validator
+
+# orjson is optional: encodes large configs much faster than the stdlib on save
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Add project root to path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+# Directories not worth descending into when listing robot project files
+ANALYZE_SKIP_DIRS = frozenset({"build", ".gradle", ".git", "node_modules", "__pycache__"})
+
+# Empty subsystem config; copied by _default_config and auto_generate_config
+_DEFAULT_CONFIG_TEMPLATE = {
+    "name": "my_subsystem",
+    "links": [],
+    "joints": [],
+    "motors": [],
+    "sensors": []
+}
+
+# Menu bar: (menu label, [(item label, app attribute to call) or None for a separator])
+MENU_SPEC = [
+    ("File", [
+        ("New Project", "new_project"),
+        ("Load Config", "load_config"),
+        ("Save Config", "save_config"),
+        ("Save Config As...", "save_config_as"),
+        None,
+        ("Exit", "quit_app"),
+    ]),
+    ("Examples", [
+        ("Load Simple Arm Example", "load_simple_arm_example"),
+        ("Download FRC CAD Resources", "show_cad_resources"),
+        ("Download Java Robot Examples", "show_java_examples"),
+    ]),
+    ("Help", [
+        ("Documentation", "show_docs"),
+        ("About", "show_about"),
+    ]),
+]
+
+# Notebook tabs, in order: (frame attribute, tab label, method that fills the frame)
+TAB_SPEC = [
+    ("cad_frame", "1. CAD Import", "_create_cad_import_tab"),
+    ("config_frame", "2. Configuration", "_create_config_tab"),
+    ("code_frame", "3. Robot Code", "_create_robot_code_tab"),
+    ("sim_frame", "4. Run Simulation", "_create_simulation_tab"),
+]
+
+# Gradle wrapper script for this OS (WPILib projects ship both)
+GRADLEW_NAME = "gradlew.bat" if os.name == 'nt' else "gradlew"
+
+# Number of robot code folder summaries kept for re-selection
+CODE_ANALYSIS_CACHE_SIZE = 8
+
+# Log widgets keep at most this many lines; the oldest LOG_TRIM_LINES go at once
+LOG_MAX_LINES = 5000
+LOG_TRIM_LINES = 1000
+
+# Compiled validators, keyed by id() of the (module-level, never freed) schema dict
+_SCHEMA_VALIDATORS: Dict[int, "Draft202012Validator"] = {}
+
+
+def _get_validator(schema: Dict):
+    """
+    Get a compiled jsonschema validator for a schema, building it on first use.
+
+    jsonschema is optional and slow to import, so it is only imported here,
+    the first time the Validate button needs it.
+
+    Args:
+        schema: JSON Schema dict (must stay alive, e.g. a module constant)
+
+    Returns:
+        Draft202012Validator instance, or None if jsonschema is not installed
+    """
+    validator = _SCHEMA_VALIDATORS.get(id(schema))
+    if validator is None:
+        try:
+            from jsonschema import Draft202012Validator
+        except ImportError:
+            return None  # Validate button falls back to the top-level key check
+        Draft202012Validator.check_schema(schema)
+        validator = _SCHEMA_VALIDATORS[id(schema)] = Draft202012Validator(schema)
+    return validator
+
+
+# Help/resource window contents
+_DOCS_TEXT = """
+SubsystemSim Documentation
+
+1. CAD IMPORT
+   - Import OBJ/STL files (meshes for your subsystem parts)
+   - For STEP files, convert to OBJ first using online tools
+   - Each mesh becomes a "link" in your mechanism
+
+2. CONFIGURATION
+   - Define joints between links (revolute, prismatic, fixed)
+   - Assign motors to joints (NEO, CIM, Falcon, etc.)
+   - Add sensors (encoders)
+   - Match HAL ports to your robot code
+
+3. ROBOT CODE
+   - Point to your Java/C++/Python robot project
+   - Code should use standard WPILib motor controllers and sensors
+
+4. SIMULATION
+   - Start simulation (launches WebSocket bridge)
+   - Run your robot code with -Phalsim flag
+   - Robot code connects and controls the physics simulation
+
+For more help, see WEBSOCKET_BRIDGE_GUIDE.md
+"""
+
+_CAD_RESOURCES_TEXT = """
+FRC CAD Resources - Download Links
+
+1. GRABCAD - FRC CAD Library
+   https://grabcad.com/library?query=frc
+   - Thousands of FRC robot CAD models
+   - Arms, elevators, intakes, drivetrains
+   - Filter by year (2020-2024)
+   - Download as STEP files
+
+2. Chief Delphi - CAD Resources Forum
+   https://www.chiefdelphi.com/c/technical/cad/15
+   - Community-shared designs
+   - Well-documented mechanisms
+   - STEP and SLDPRT formats
+
+3. WCP (West Coast Products) - CAD Downloads
+   https://www.wcproducts.com/
+   - Professional FRC components
+   - Greyt Elevator, Greyt Arm
+   - STEP files available
+
+4. Everybot CAD
+   https://www.robowranglers148.com/uploads/1/0/5/4/10542658/2024_everybot_cad.zip
+   - Simple, well-documented arm
+   - Perfect for testing
+   - SLDASM format (can export STEP)
+
+5. Online STEP to OBJ Converter
+   https://convert3d.org/step-to-obj
+   - Convert STEP → OBJ for SubsystemSim
+   - Free, no account needed
+
+INSTRUCTIONS:
+1. Download STEP file from any source above
+2. Convert to OBJ using online converter
+3. Import OBJ files in SubsystemSim CAD Import tab
+4. Auto-generate configuration
+5. Test with simulation!
+"""
+
+_JAVA_EXAMPLES_TEXT = """
+Java Robot Code Examples - Download Links
+
+1. WPILib Example Projects (OFFICIAL)
+   https://github.com/wpilibsuite/allwpilib/tree/main/wpilibjExamples
+   - Official WPILib Java examples
+   - Motor control, encoders, PID
+   - Clone with: git clone https://github.com/wpilibsuite/allwpilib.git
+   - Examples in: wpilibjExamples/src/main/java/edu/wpi/first/wpilibj/examples/
+
+2. Simple Arm Example (Recommended for Testing)
+   https://github.com/wpilibsuite/allwpilib/tree/main/wpilibjExamples/src/main/java/edu/wpi/first/wpilibj/examples/armbot
+   - Single-joint arm with PID control
+   - Uses PWM motor and encoder
+   - Perfect match for simple arm CAD
+
+3. Elevator Example
+   https://github.com/wpilibsuite/allwpilib/tree/main/wpilibjExamples/src/main/java/edu/wpi/first/wpilibj/examples/elevatorbot
+   - Vertical motion (prismatic joint)
+   - Trapezoidal motion profiling
+
+4. FRC 2024 Robot Code Examples (Chief Delphi)
+   https://www.chiefdelphi.com/t/2024-robot-code-repositories/450816
+   - Real team code from 2024 season
+   - Production-quality examples
+   - Various subsystem designs
+
+5. Create New Java Robot Project
+   Run in terminal:
+   > wpilib create project
+   - Creates new Java robot project
+   - Includes Gradle build files
+   - Ready for simulation
+
+QUICK START FOR TESTING:
+1. Download ArmBot example from link #2
+2. Extract to a folder
+3. In SubsystemSim, go to "Robot Code" tab
+4. Browse to the extracted folder
+5. In terminal: gradlew simulateJava -Phalsim
+6. Robot code connects to SubsystemSim!
+
+PORT MAPPING:
+Make sure robot code motor/sensor ports match your SubsystemSim config:
+- Motor: PWMSparkMax(PORT) → config: "hal_port": PORT
+- Encoder: Encoder(PORT_A, PORT_B) → config: "hal_ports": [PORT_A, PORT_B]
+"""
+
+
+@functools.lru_cache(maxsize=8)
+def _scan_meshes(dir_str: str, mtime_ns: int) -> tuple:
+    """
+    List the OBJ files in a directory (cached while the directory is unchanged).
+
+    Args:
+        dir_str: Directory to scan
+        mtime_ns: Directory mtime; part of the cache key only
+
+    Returns:
+        Tuple of OBJ file paths, sorted by name
+    """
+    with os.scandir(dir_str) as entries:
+        return tuple(Path(entry.path) for entry in sorted(entries, key=lambda e: e.name)
+                     if entry.name.endswith('.obj') and entry.is_file())
+
+
+def _subprocess():
+    """Import subprocess on first use; most sessions never start a process."""
+    import subprocess
+    return subprocess
+
+
+def _open_with(opener: str):
+    """Make a folder opener that runs an external command (imported lazily)."""
+    def open_folder(folder):
+        subprocess = _subprocess()
+        subprocess.run([opener, folder])
+    return open_folder
+
+
+# Opens a folder in the platform file manager
+if sys.platform == 'win32':
+    _open_folder = os.startfile
+else:
+    _open_folder = _open_with('open' if sys.platform == 'darwin' else 'xdg-open')
+
+
+def process_group_kwargs() -> Dict:
+    """
+    Popen arguments that start a child in its own process group/session.
+
+    Lets kill_process_tree() stop everything the child spawned (the JVM under
+    Gradle, the PyBullet window under the bridge), not just the child itself.
+
+    Returns:
+        Keyword arguments for subprocess.Popen
+    """
+    subprocess = _subprocess()
+    if os.name == 'nt':
+        return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {"start_new_session": True}
+
+
+def kill_process_tree(proc, timeout: float = 5.0):
+    """
+    Terminate a process started with process_group_kwargs() and its children.
+
+    Asks politely first and kills whatever is left after the timeout.
+    Blocks for up to the timeout, so call it off the Tk thread.
+
+    Args:
+        proc: subprocess.Popen to stop
+        timeout: Seconds to wait for a clean exit before killing
+    """
+    subprocess = _subprocess()
+    if proc.poll() is not None:
+        return
+
+    if os.name == 'nt':
+        # taskkill /T walks the child tree (gradlew.bat -> java, ...)
+        subprocess.run(["taskkill", "/T", "/F", "/PID", str(proc.pid)],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        proc.wait(timeout)
+        return
+
+    import signal
+    try:
+        os.killpg(proc.pid, signal.SIGTERM)  # pgid == pid with start_new_session
+    except ProcessLookupError:
+        return
+    try:
+        proc.wait(timeout)
+    except subprocess.TimeoutExpired:
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        proc.wait()
+
+
+def iter_process_output(proc):
+    """
+    Yield raw stdout chunks from a process until it closes its output.
+
+    The process is used as a context manager, so its pipe is closed and the
+    process is waited on when the stream ends or the consumer stops early.
+
+    Args:
+        proc: subprocess.Popen started with stdout=PIPE in binary mode
+
+    Yields:
+        Non-empty bytes chunks, as soon as they are available
+    """
+    with proc:
+        yield from iter(lambda: proc.stdout.read1(65536), b'')
+
 
 class SubsystemSimApp:
     """Main GUI application for SubsystemSim."""
@@ -33,58 +353,65 @@ class SubsystemSimApp:
         self.root = root
         self.root.title("SubsystemSim - FRC Subsystem Simulator")
         self.root.geometry("1200x800")
+        # Closing the window goes through quit_app so running processes are stopped
+        self.root.protocol("WM_DELETE_WINDOW", self.quit_app)
 
         # Application state
         self.cad_files: List[Path] = []
+        self._cad_files_set: Set[Path] = set()  # Mirrors cad_files for O(1) duplicate checks
+        self._cad_abs: Dict[Path, str] = {}  # Absolute path strings, resolved once on import
+        # Last folder used per kind of file dialog ('cad', 'step', 'step_out', 'config', 'code')
+        self._last_dirs: Dict[str, str] = {}
+        # Open help/resource windows by topic (see _show_text_window)
+        self._doc_windows: Dict[str, tk.Toplevel] = {}
+        # Robot code summaries keyed by (folder, folder mtime), most recent last
+        self._code_analysis_cache: "OrderedDict[tuple, str]" = OrderedDict()
+        # Robot command for the last analyzed folder, keyed like _code_analysis_cache
+        self._robot_cmd_cache: Dict[tuple, Optional[List[str]]] = {}
         self.robot_code_path: Optional[Path] = None
         self.config_data: Dict = self._default_config()
         self.config_file_path: Optional[Path] = None
-        self.simulation_process: Optional[subprocess.Popen] = None
+        self.simulation_process: Optional["subprocess.Popen"] = None
+        self.robot_process: Optional["subprocess.Popen"] = None
+        # Started processes (any run) not reaped yet; Start stays disabled until empty
+        self._live_processes: Set["subprocess.Popen"] = set()
+        # (editor text, parsed dict) from the last parse; see _parse_config_text
+        self._config_cache: Optional[Tuple[str, Dict]] = None
+        # after_idle id of a pending editor refresh (see _update_config_display)
+        self._config_display_pending: Optional[str] = None
+        # Output from the robot/bridge reader threads; drained into sim_log on the Tk thread
+        self._sim_log_queue = queue.Queue()
+        # Output lines held back while the log is not on screen (newest LOG_MAX_LINES lines)
+        self._sim_log_hidden = deque(maxlen=LOG_MAX_LINES)
 
         # Build UI
         self._create_menu()
         self._create_main_layout()
+        self.root.after(100, self._drain_sim_log)
+        # Import the CAD tools (PythonOCC/Qt, slow) in the background once the window is up
+        self.root.after(500, self._warm_cad_import)
 
         # Status
         self.status_var.set("Ready - Import CAD files to begin")
 
     def _default_config(self) -> Dict:
         """Create default configuration structure."""
-        return {
-            "name": "my_subsystem",
-            "links": [],
-            "joints": [],
-            "motors": [],
-            "sensors": []
-        }
+        return copy.deepcopy(_DEFAULT_CONFIG_TEMPLATE)
 
     def _create_menu(self):
         """Create menu bar."""
         menubar = tk.Menu(self.root)
         self.root.config(menu=menubar)
 
-        # File menu
-        file_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="File", menu=file_menu)
-        file_menu.add_command(label="New Project", command=self.new_project)
-        file_menu.add_command(label="Load Config", command=self.load_config)
-        file_menu.add_command(label="Save Config", command=self.save_config)
-        file_menu.add_command(label="Save Config As...", command=self.save_config_as)
-        file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit)
-
-        # Examples menu
-        examples_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Examples", menu=examples_menu)
-        examples_menu.add_command(label="Load Simple Arm Example", command=self.load_simple_arm_example)
-        examples_menu.add_command(label="Download FRC CAD Resources", command=self.show_cad_resources)
-        examples_menu.add_command(label="Download Java Robot Examples", command=self.show_java_examples)
-
-        # Help menu
-        help_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Help", menu=help_menu)
-        help_menu.add_command(label="Documentation", command=self.show_docs)
-        help_menu.add_command(label="About", command=self.show_about)
+        for menu_label, items in MENU_SPEC:
+            menu = tk.Menu(menubar, tearoff=0)
+            menubar.add_cascade(label=menu_label, menu=menu)
+            for item in items:
+                if item is None:
+                    menu.add_separator()
+                else:
+                    label, command = item
+                    menu.add_command(label=label, command=operator.attrgetter(command)(self))
 
     def _create_main_layout(self):
         """Create main application layout."""
@@ -92,25 +419,12 @@ class SubsystemSimApp:
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
-        # Tab 1: CAD Import
-        self.cad_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.cad_frame, text="1. CAD Import")
-        self._create_cad_import_tab()
-
-        # Tab 2: Config Editor
-        self.config_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.config_frame, text="2. Configuration")
-        self._create_config_tab()
-
-        # Tab 3: Robot Code
-        self.code_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.code_frame, text="3. Robot Code")
-        self._create_robot_code_tab()
-
-        # Tab 4: Simulation
-        self.sim_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.sim_frame, text="4. Run Simulation")
-        self._create_simulation_tab()
+        # Tabs (notebook.select() elsewhere relies on this order)
+        for frame_attr, label, build in TAB_SPEC:
+            frame = ttk.Frame(self.notebook)
+            setattr(self, frame_attr, frame)
+            self.notebook.add(frame, text=label)
+            getattr(self, build)()
 
         # Status bar
         self.status_var = tk.StringVar()
@@ -171,6 +485,7 @@ class SubsystemSimApp:
 
         self.config_text = scrolledtext.ScrolledText(editor_frame, height=25, width=80)
         self.config_text.pack(fill=tk.BOTH, expand=True)
+        self.config_text.bind('<<Modified>>', self._on_config_modified)
 
         # Buttons
         button_frame = ttk.Frame(self.config_frame)
@@ -273,6 +588,7 @@ class SubsystemSimApp:
         """Import CAD files (OBJ, STL)."""
         files = filedialog.askopenfilenames(
             title="Select CAD Mesh Files",
+            initialdir=self._last_dirs.get('cad'),
             filetypes=[
                 ("Mesh Files", "*.obj *.stl"),
                 ("OBJ Files", "*.obj"),
@@ -282,11 +598,14 @@ class SubsystemSimApp:
         )
 
         if files:
+            self._last_dirs['cad'] = str(Path(files[0]).parent)
+            new_paths = []
             for file_path in files:
                 path = Path(file_path)
-                if path not in self.cad_files:
-                    self.cad_files.append(path)
-                    self.cad_listbox.insert(tk.END, f"{path.stem} ({path.suffix})")
+                if path not in self._cad_files_set:
+                    self._cad_files_set.add(path)
+                    new_paths.append(path)
+            self._add_cad_files(new_paths)
 
             self.status_var.set(f"Imported {len(files)} CAD file(s)")
 
@@ -346,6 +665,7 @@ class SubsystemSimApp:
         # FreeCAD is available, proceed with conversion
         step_files = filedialog.askopenfilenames(
             title="Select STEP Files to Convert",
+            initialdir=self._last_dirs.get('step'),
             filetypes=[
                 ("STEP Files", "*.step *.stp"),
                 ("All Files", "*.*")
@@ -354,14 +674,17 @@ class SubsystemSimApp:
 
         if not step_files:
             return
+        self._last_dirs['step'] = str(Path(step_files[0]).parent)
 
         # Ask for output directory
         output_dir = filedialog.askdirectory(
-            title="Select Output Directory for OBJ Files"
+            title="Select Output Directory for OBJ Files",
+            initialdir=self._last_dirs.get('step_out', self._last_dirs['step'])
         )
 
         if not output_dir:
             return
+        self._last_dirs['step_out'] = output_dir
 
         output_path = Path(output_dir)
 
@@ -371,6 +694,8 @@ class SubsystemSimApp:
         progress_window.geometry("500x300")
         progress_window.transient(self.root)
         progress_window.grab_set()
+        # Keep the window open until the worker finishes (it owns the result)
+        progress_window.protocol("WM_DELETE_WINDOW", lambda: None)
 
         ttk.Label(
             progress_window,
@@ -381,69 +706,119 @@ class SubsystemSimApp:
         log_text = scrolledtext.ScrolledText(progress_window, height=15, width=60)
         log_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-        # Redirect print output to log window
-        class GUILogger:
+        # The conversion runs on a worker thread (it can take minutes and would
+        # freeze the GUI); its printed output comes back through this queue and
+        # is inserted by _drain below, since Tk must only be touched from here
+        log_queue = queue.Queue()
+        outcome = {}
+
+        class QueueWriter:
             def write(self, message):
-                log_text.insert(tk.END, message)
-                log_text.see(tk.END)
-                progress_window.update()
+                log_queue.put(message)
 
             def flush(self):
                 pass
 
-        old_stdout = sys.stdout
-        sys.stdout = GUILogger()
-
-        try:
-            # Convert all STEP files
+        def convert():
             from subsystemsim.cad import batch_convert_step_files
+            try:
+                with contextlib.redirect_stdout(QueueWriter()):
+                    outcome['obj_files'] = batch_convert_step_files(
+                        [Path(f) for f in step_files],
+                        output_path
+                    )
+            except Exception as e:
+                outcome['error'] = e
+            log_queue.put(None)  # Sentinel: conversion finished
 
-            obj_files = batch_convert_step_files(
-                [Path(f) for f in step_files],
-                output_path
-            )
+        def drain():
+            try:
+                while True:
+                    message = log_queue.get_nowait()
+                    if message is None:
+                        self._finish_step_conversion(progress_window, len(step_files),
+                                                     output_path, outcome)
+                        return
+                    log_text.insert(tk.END, message)
+            except queue.Empty:
+                pass
+            self._trim_log(log_text)
+            log_text.see(tk.END)
+            progress_window.after(50, drain)
 
-            # Restore stdout
-            sys.stdout = old_stdout
+        threading.Thread(target=convert, daemon=True).start()
+        progress_window.after(50, drain)
 
-            if obj_files:
-                # Ask if user wants to import the converted files
-                result = messagebox.askyesno(
-                    "Conversion Complete",
-                    f"Successfully converted {len(step_files)} STEP file(s) to {len(obj_files)} OBJ file(s).\n\n"
-                    f"Output directory: {output_path}\n\n"
-                    "Would you like to import the OBJ files now?"
-                )
+    def _finish_step_conversion(self, progress_window, num_step_files: int,
+                                output_path: Path, outcome: Dict):
+        """Report a finished STEP conversion and offer to import the OBJ files (Tk thread)."""
+        if 'error' in outcome:
+            progress_window.destroy()
+            messagebox.showerror("Conversion Error", f"Error during conversion:\n{outcome['error']}")
+            return
+
+        obj_files = outcome['obj_files']
+        if not obj_files:
+            progress_window.destroy()
+            messagebox.showerror("Conversion Failed", "No OBJ files were created. Check the log for errors.")
+            return
 
-                progress_window.destroy()
+        # Ask if user wants to import the converted files
+        result = messagebox.askyesno(
+            "Conversion Complete",
+            f"Successfully converted {num_step_files} STEP file(s) to {len(obj_files)} OBJ file(s).\n\n"
+            f"Output directory: {output_path}\n\n"
+            "Would you like to import the OBJ files now?"
+        )
 
-                if result:
-                    # Import the converted OBJ files
-                    for obj_file in obj_files:
-                        if obj_file not in self.cad_files:
-                            self.cad_files.append(obj_file)
-                            self.cad_listbox.insert(tk.END, f"{obj_file.stem} (.obj)")
+        progress_window.destroy()
 
-                    self.status_var.set(f"Converted and imported {len(obj_files)} OBJ file(s)")
-            else:
-                sys.stdout = old_stdout
-                progress_window.destroy()
-                messagebox.showerror("Conversion Failed", "No OBJ files were created. Check the log for errors.")
+        if result:
+            # Import the converted OBJ files
+            new_paths = [obj_file for obj_file in obj_files if obj_file not in self._cad_files_set]
+            self._cad_files_set.update(new_paths)
+            self._add_cad_files(new_paths)
 
-        except Exception as e:
-            sys.stdout = old_stdout
-            progress_window.destroy()
-            messagebox.showerror("Conversion Error", f"Error during conversion:\n{e}")
+            self.status_var.set(f"Converted and imported {len(obj_files)} OBJ file(s)")
 
     def _open_url(self, url: str):
         """Open URL in default browser."""
         import webbrowser
         webbrowser.open(url)
 
+    def _add_cad_files(self, paths: List[Path]):
+        """
+        Append CAD files to the list and the listbox in one go.
+
+        A single Listbox insert with all items means one redraw, not one per file.
+
+        Args:
+            paths: New files (already checked against _cad_files_set)
+        """
+        if not paths:
+            return
+        cwd = os.getcwd()
+        for p in paths:
+            self._cad_abs[p] = str(p) if p.is_absolute() else os.path.join(cwd, p)
+        self.cad_files.extend(paths)
+        self.cad_listbox.insert(tk.END, *(f"{p.stem} ({p.suffix})" for p in paths))
+
+    def _warm_cad_import(self):
+        """Start importing subsystemsim.cad on a daemon thread so the STEP tools open quickly."""
+        def warm():
+            try:
+                import subsystemsim.cad  # noqa: F401
+            except Exception:
+                pass  # PythonOCC/FreeCAD missing; the STEP tools report it when used
+
+        threading.Thread(target=warm, daemon=True).start()
+
     def clear_cad(self):
         """Clear all imported CAD files."""
         if messagebox.askyesno("Clear CAD Files", "Remove all imported CAD files?"):
             self.cad_files.clear()
+            self._cad_files_set.clear()
+            self._cad_abs.clear()
             self.cad_listbox.delete(0, tk.END)
             self.status_var.set("Cleared all CAD files")
 
@@ -454,19 +829,14 @@ class SubsystemSimApp:
             return
 
         # Create config with links from CAD files
-        config = {
-            "name": "my_subsystem",
-            "links": [],
-            "joints": [],
-            "motors": [],
-            "sensors": []
-        }
+        config = self._default_config()
 
         # Add each CAD file as a link
+        prev_name = None
         for i, cad_file in enumerate(self.cad_files):
             link = {
                 "name": cad_file.stem,
-                "mesh": str(cad_file.absolute()),
+                "mesh": self._cad_abs[cad_file],
                 "mass": 1.0,
                 "center_of_mass": [0.0, 0.0, 0.0],
                 "inertia": None
@@ -478,7 +848,7 @@ class SubsystemSimApp:
                 joint = {
                     "name": f"joint_{i}",
                     "type": "revolute",
-                    "parent": config["links"][i-1]["name"],
+                    "parent": prev_name,
                     "child": link["name"],
                     "axis": [0.0, 0.0, 1.0],
                     "origin": [0.0, 0.0, 0.1],
@@ -510,6 +880,8 @@ class SubsystemSimApp:
                 }
                 config["sensors"].append(sensor)
 
+            prev_name = link["name"]
+
         self.config_data = config
         self._update_config_display()
         self.notebook.select(1)  # Switch to config tab
@@ -528,20 +900,61 @@ class SubsystemSimApp:
     # ==================== Config Methods ====================
 
     def _update_config_display(self):
-        """Update config editor with current config data."""
+        """
+        Update config editor with current config data on the next idle cycle.
+
+        Keeps the click handler (and the dialog it usually shows) responsive for
+        large configs; repeated calls before the refresh only refresh once.
+        """
+        if self._config_display_pending is None:
+            self._config_display_pending = self.root.after_idle(self._do_update_config_display)
+
+    def _do_update_config_display(self):
+        """Rewrite the config editor text from config_data now."""
+        self._config_display_pending = None
         self.config_text.delete('1.0', tk.END)
-        self.config_text.insert('1.0', json.dumps(self.config_data, indent=2))
+        self.config_text.insert('1.0', json.dumps(self.config_data, indent=2, ensure_ascii=False))
+
+    def _on_config_modified(self, event=None):
+        """Drop the parsed config cache when the editor text changes."""
+        self._config_cache = None
+        # <<Modified>> only fires again once the flag is reset
+        self.config_text.edit_modified(False)
+
+    def _parse_config_text(self) -> Dict:
+        """
+        Parse the JSON in the config editor, reusing the last result if unchanged.
+
+        Returns:
+            Parsed configuration dict
+
+        Raises:
+            json.JSONDecodeError: If the editor text is not valid JSON
+        """
+        if self._config_display_pending is not None:
+            # Parse what config_data says, not the stale text
+            self.root.after_cancel(self._config_display_pending)
+            self._do_update_config_display()
+        config_text = self.config_text.get('1.0', tk.END)
+        # Compare the text itself: equal hashes don't mean equal JSON
+        if self._config_cache is not None and self._config_cache[0] == config_text:
+            return self._config_cache[1]
+        parsed = json.loads(config_text)
+        self._config_cache = (config_text, parsed)
+        return parsed
 
     def load_config(self):
         """Load configuration from file."""
         file_path = filedialog.askopenfilename(
             title="Load Configuration",
+            initialdir=self._last_dirs.get('config'),
             filetypes=[("JSON Files", "*.json"), ("All Files", "*.*")]
         )
 
         if file_path:
+            self._last_dirs['config'] = str(Path(file_path).parent)
             try:
-                with open(file_path, 'r') as f:
+                with open(file_path, 'r', encoding='utf-8') as f:
                     self.config_data = json.load(f)
                 self.config_file_path = Path(file_path)
                 self._update_config_display()
@@ -560,23 +973,23 @@ class SubsystemSimApp:
         """Save configuration to new file."""
         file_path = filedialog.asksaveasfilename(
             title="Save Configuration",
+            initialdir=self._last_dirs.get('config'),
             defaultextension=".json",
             filetypes=[("JSON Files", "*.json"), ("All Files", "*.*")]
         )
 
         if file_path:
+            self._last_dirs['config'] = str(Path(file_path).parent)
             self._save_config_to_file(Path(file_path))
 
     def _save_config_to_file(self, file_path: Path):
         """Save config data to file."""
         try:
             # Parse current text in editor
-            config_text = self.config_text.get('1.0', tk.END)
-            self.config_data = json.loads(config_text)
+            self.config_data = self._parse_config_text()
 
-            # Save to file
-            with open(file_path, 'w') as f:
-                json.dump(self.config_data, f, indent=2)
+            # Save to file (UTF-8, serialized straight to the file handle)
+            self._write_config_json(file_path, self.config_data)
 
             self.config_file_path = file_path
             self.status_var.set(f"Saved config: {file_path.name}")
@@ -585,11 +998,36 @@ class SubsystemSimApp:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save config:\n{e}")
 
+    @staticmethod
+    def _write_config_json(file_path: Path, data: Dict):
+        """
+        Write a config dict as indented UTF-8 JSON.
+
+        Uses orjson when installed, otherwise streams json.dump into a
+        buffered file instead of building the whole string first.
+
+        Args:
+            file_path: Output file
+            data: Config dict
+        """
+        if ORJSON_AVAILABLE:
+            try:
+                encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            except TypeError:
+                pass  # e.g. non-string keys; the stdlib handles those
+            else:
+                with open(file_path, 'wb') as f:
+                    f.write(encoded)
+                    f.write(b"\n")
+                return
+
+        with open(file_path, 'w', encoding='utf-8', buffering=65536) as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
     def validate_config(self):
         """Validate configuration JSON."""
         try:
-            config_text = self.config_text.get('1.0', tk.END)
-            config = json.loads(config_text)
+            config = self._parse_config_text()
 
             # Basic validation
             required_keys = ["name", "links", "joints", "motors", "sensors"]
@@ -598,13 +1036,29 @@ class SubsystemSimApp:
             if missing:
                 messagebox.showwarning("Validation Warning",
                     f"Missing required keys: {', '.join(missing)}")
-            else:
-                messagebox.showinfo("Validation Success",
-                    "Configuration is valid!\n\n"
-                    f"Links: {len(config['links'])}\n"
-                    f"Joints: {len(config['joints'])}\n"
-                    f"Motors: {len(config['motors'])}\n"
-                    f"Sensors: {len(config['sensors'])}")
+                return
+
+            from subsystemsim.core.config import SUBSYSTEM_SCHEMA
+            validator = _get_validator(SUBSYSTEM_SCHEMA)
+            if validator is not None:
+                errors = sorted(validator.iter_errors(config),
+                                key=lambda err: [str(p) for p in err.absolute_path])
+                if errors:
+                    details = "\n".join(
+                        f"- {'/'.join(str(p) for p in err.absolute_path) or '(root)'}: {err.message}"
+                        for err in errors[:10]
+                    )
+                    more = f"\n... and {len(errors) - 10} more" if len(errors) > 10 else ""
+                    messagebox.showwarning("Validation Warning",
+                        f"Configuration has {len(errors)} problem(s):\n\n{details}{more}")
+                    return
+
+            messagebox.showinfo("Validation Success",
+                "Configuration is valid!\n\n"
+                f"Links: {len(config['links'])}\n"
+                f"Joints: {len(config['joints'])}\n"
+                f"Motors: {len(config['motors'])}\n"
+                f"Sensors: {len(config['sensors'])}")
         except json.JSONDecodeError as e:
             messagebox.showerror("Invalid JSON", f"Configuration has invalid JSON:\n{e}")
 
@@ -619,9 +1073,11 @@ class SubsystemSimApp:
 
     def browse_robot_code(self):
         """Browse for robot code folder."""
-        folder_path = filedialog.askdirectory(title="Select Robot Code Folder")
+        folder_path = filedialog.askdirectory(title="Select Robot Code Folder",
+                                              initialdir=self._last_dirs.get('code'))
 
         if folder_path:
+            self._last_dirs['code'] = str(Path(folder_path).parent)
             self.robot_code_path = Path(folder_path)
             self.code_path_var.set(str(self.robot_code_path))
             self._analyze_robot_code()
@@ -632,6 +1088,47 @@ class SubsystemSimApp:
         if not self.robot_code_path:
             return
 
+        # Re-selecting an unchanged folder reuses the last scan
+        cache_key = self._robot_code_key()
+        self._get_robot_command(cache_key)  # Resolve now so Start doesn't have to
+        text = self._code_analysis_cache.get(cache_key) if cache_key else None
+        if text is not None:
+            self._code_analysis_cache.move_to_end(cache_key)
+        else:
+            text = self._scan_robot_code()
+            if cache_key:
+                self._code_analysis_cache[cache_key] = text
+                if len(self._code_analysis_cache) > CODE_ANALYSIS_CACHE_SIZE:
+                    self._code_analysis_cache.popitem(last=False)
+
+        # Update display
+        self.code_info_text.config(state=tk.NORMAL)
+        self.code_info_text.delete('1.0', tk.END)
+        self.code_info_text.insert('1.0', text)
+        self.code_info_text.config(state=tk.DISABLED)
+
+    def _robot_code_key(self) -> Optional[tuple]:
+        """
+        Cache key for the selected robot code folder.
+
+        The folder's mtime changes when files are added/removed/renamed directly
+        inside it (e.g. build.gradle or robot.py appearing).
+
+        Returns:
+            (path, st_mtime_ns), or None if the folder can't be stat'ed
+        """
+        try:
+            return (self.robot_code_path, self.robot_code_path.stat().st_mtime_ns)
+        except OSError:
+            return None
+
+    def _scan_robot_code(self) -> str:
+        """
+        Build the robot code summary shown in the Robot Code tab.
+
+        Returns:
+            Summary text (project type, run instructions, notable files)
+        """
         info = []
         info.append(f"Robot Code Path: {self.robot_code_path}\n")
         info.append("="*60 + "\n\n")
@@ -653,22 +1150,31 @@ class SubsystemSimApp:
             info.append("Project Type: Unknown\n")
             info.append("Could not detect Java, C++, or Python robot code.\n\n")
 
-        # List important files
+        # List important files (one walk for all patterns, skipping build output)
         info.append("Project Files:\n")
-        for pattern in ["*.java", "*.cpp", "*.py", "*.json", "build.gradle"]:
-            files = list(self.robot_code_path.rglob(pattern))
+        patterns = ["*.java", "*.cpp", "*.py", "*.json", "build.gradle"]
+        buckets = {pattern: [] for pattern in patterns}
+        root_dir = str(self.robot_code_path)
+        for dir_path, dir_names, file_names in os.walk(root_dir):
+            dir_names[:] = [d for d in dir_names if d not in ANALYZE_SKIP_DIRS]
+            for name in file_names:
+                if name == "build.gradle":
+                    bucket = buckets["build.gradle"]
+                else:
+                    bucket = buckets.get("*" + os.path.splitext(name)[1])
+                if bucket is not None:
+                    bucket.append(os.path.relpath(os.path.join(dir_path, name), root_dir))
+
+        for pattern in patterns:
+            files = buckets[pattern]
             if files:
                 info.append(f"\n{pattern} files: ({len(files)})\n")
                 for f in files[:5]:  # Show first 5
-                    info.append(f"  - {f.relative_to(self.robot_code_path)}\n")
+                    info.append(f"  - {f}\n")
                 if len(files) > 5:
                     info.append(f"  ... and {len(files)-5} more\n")
 
-        # Update display
-        self.code_info_text.config(state=tk.NORMAL)
-        self.code_info_text.delete('1.0', tk.END)
-        self.code_info_text.insert('1.0', ''.join(info))
-        self.code_info_text.config(state=tk.DISABLED)
+        return ''.join(info)
 
     # ==================== Simulation Methods ====================
 
@@ -698,6 +1204,7 @@ class SubsystemSimApp:
 
         try:
             self.sim_log.delete('1.0', tk.END)
+            self._sim_log_hidden.clear()
             self.sim_log.insert(tk.END, "Starting Simulation...\n\n")
 
             # Detect project type and prepare robot code command
@@ -716,26 +1223,33 @@ class SubsystemSimApp:
             self.sim_log.insert(tk.END, f"Robot code command: {' '.join(robot_cmd)}\n")
             self.sim_log.insert(tk.END, "Starting robot code...\n\n")
 
+            subprocess = _subprocess()
+
             # Start robot code process (it will create WebSocket server)
+            # Binary with a large buffer: a chatty Gradle build is read in big
+            # chunks instead of line by line (see _pump_output)
             self.robot_process = subprocess.Popen(
                 robot_cmd,
                 cwd=str(self.robot_code_path),
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1
+                bufsize=65536,
+                **process_group_kwargs()
             )
+            self._live_processes.add(self.robot_process)
 
             # Start robot code log reader
-            self.robot_log_thread = threading.Thread(
-                target=self._read_robot_output,
+            threading.Thread(
+                target=self._pump_output,
+                args=(self.robot_process, "[ROBOT] ",
+                      functools.partial(self._robot_ended, self.robot_process)),
                 daemon=True
-            )
-            self.robot_log_thread.start()
+            ).start()
 
             # Wait a moment for robot code to start WebSocket server
             self.sim_log.insert(tk.END, "Waiting for robot code to initialize...\n")
-            self.root.after(3000, self._start_websocket_bridge)  # Wait 3 seconds
+            self.root.after(3000, functools.partial(self._start_websocket_bridge,
+                                                    self.robot_process))  # Wait 3 seconds
 
             # Update UI
             self.start_sim_btn.config(state=tk.DISABLED)
@@ -746,23 +1260,40 @@ class SubsystemSimApp:
             messagebox.showerror("Error", f"Failed to start simulation:\n{e}")
             self.sim_log.insert(tk.END, f"\nERROR: {e}\n")
 
-    def _get_robot_command(self):
-        """Determine robot code command based on project type."""
+    def _get_robot_command(self, cache_key: Optional[tuple] = None):
+        """
+        Determine robot code command based on project type.
+
+        Args:
+            cache_key: _robot_code_key() if the caller already has it
+
+        Returns:
+            Command list, or None if the project type is not recognized
+        """
         if not self.robot_code_path:
             return None
 
+        if cache_key is None:
+            cache_key = self._robot_code_key()
+        if cache_key in self._robot_cmd_cache:
+            return self._robot_cmd_cache[cache_key]
+
+        cmd = self._detect_robot_command()
+        if cache_key is not None:
+            self._robot_cmd_cache = {cache_key: cmd}
+        return cmd
+
+    def _detect_robot_command(self):
+        """Build the robot code command from the files in the project folder."""
         # Check for Gradle project (Java/C++)
         build_gradle = self.robot_code_path / "build.gradle"
-        gradlew = self.robot_code_path / "gradlew.bat"  # Windows
-        gradlew_unix = self.robot_code_path / "gradlew"  # Linux/Mac
+        gradlew = self.robot_code_path / GRADLEW_NAME
 
         if build_gradle.exists():
             # It's a Gradle project
             if gradlew.exists():
                 # Java project (most common)
                 return [str(gradlew), "simulateJava", "-Phalsim"]
-            elif gradlew_unix.exists():
-                return [str(gradlew_unix), "simulateJava", "-Phalsim"]
             else:
                 # No gradlew wrapper, use system gradle
                 return ["gradle", "simulateJava", "-Phalsim"]
@@ -775,8 +1306,16 @@ class SubsystemSimApp:
 
         return None
 
-    def _start_websocket_bridge(self):
-        """Start WebSocket bridge after robot code has initialized."""
+    def _start_websocket_bridge(self, robot_process):
+        """
+        Start WebSocket bridge after robot code has initialized.
+
+        Args:
+            robot_process: Robot code process of the run this bridge belongs to
+        """
+        if robot_process is not self.robot_process:
+            return  # That run was stopped (or its robot code exited) in the meantime
+
         try:
             self.sim_log.insert(tk.END, "\nStarting WebSocket bridge...\n\n")
 
@@ -786,93 +1325,206 @@ class SubsystemSimApp:
                 "--config", str(self.config_file_path)
             ]
 
+            subprocess = _subprocess()
             self.simulation_process = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1
+                bufsize=65536,
+                **process_group_kwargs()
             )
+            self._live_processes.add(self.simulation_process)
 
             # Start log reader thread
-            self.log_thread = threading.Thread(target=self._read_simulation_output, daemon=True)
-            self.log_thread.start()
+            threading.Thread(
+                target=self._pump_output,
+                args=(self.simulation_process, "",
+                      functools.partial(self._simulation_ended, self.simulation_process)),
+                daemon=True
+            ).start()
 
             self.status_var.set("Simulation running")
 
         except Exception as e:
             self.sim_log.insert(tk.END, f"\nERROR starting bridge: {e}\n")
 
-    def _read_robot_output(self):
-        """Read robot code output in background thread."""
-        if not self.robot_process:
-            return
-
-        for line in self.robot_process.stdout:
-            self.sim_log.insert(tk.END, f"[ROBOT] {line}")
-            self.sim_log.see(tk.END)
+    def _pump_output(self, proc, prefix: str, on_end):
+        """
+        Forward a process's output to the simulation log (background thread).
+
+        Reads whatever is available in large chunks, so the pipe never fills up
+        and stalls the process, and queues whole lines for _drain_sim_log.
+        Tk is never touched from here. Returns once the process has exited
+        (e.g. terminated by stop_simulation) and been reaped.
+
+        Args:
+            proc: Process started with a binary stdout pipe
+            prefix: Text put in front of every line
+            on_end: Called on the Tk thread once the process has exited and been reaped
+        """
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        pending = ""
+        for chunk in iter_process_output(proc):
+            lines = (pending + decoder.decode(chunk)).split('\n')
+            pending = lines.pop()  # Partial last line, completed by the next chunk
+            if lines:
+                lines = [line.rstrip('\r') for line in lines]
+                self._sim_log_queue.put("".join(f"{prefix}{line}\n" for line in lines))
+
+        pending += decoder.decode(b'', final=True)
+        if pending:
+            self._sim_log_queue.put(f"{prefix}{pending}\n")
 
         # Process ended
-        self.root.after(0, self._robot_ended)
+        self._sim_log_queue.put(on_end)
 
-    def _robot_ended(self):
-        """Handle robot code process ending."""
-        self.sim_log.insert(tk.END, "\n[ROBOT] Robot code stopped\n")
-        if hasattr(self, 'simulation_process') and self.simulation_process:
-            self.simulation_process.terminate()
+    def _drain_sim_log(self):
+        """
+        Move queued process output into the simulation log (Tk thread, every 100 ms).
 
-    def _read_simulation_output(self):
-        """Read simulation output in background thread."""
-        if not self.simulation_process:
+        Everything queued since the last tick goes in as one insert and one
+        scroll, however many lines the processes printed.
+        """
+        pending = []
+        try:
+            while True:
+                item = self._sim_log_queue.get_nowait()
+                if callable(item):
+                    # End-of-process callback: show the output that came before it first
+                    self._flush_sim_log(pending, force=True)
+                    pending = []
+                    item()
+                else:
+                    pending.append(item)
+        except queue.Empty:
+            pass
+        self._flush_sim_log(pending)
+        self.root.after(100, self._drain_sim_log)
+
+    def _flush_sim_log(self, chunks: List[str], force: bool = False):
+        """
+        Insert queued output chunks into the simulation log in a single update.
+
+        While the log tab is not shown, only the newest LOG_MAX_LINES lines are
+        kept and inserted once it is, so a hidden log costs no Tk layout work.
+
+        Args:
+            chunks: Output text gathered since the last flush
+            force: Insert even if the log is hidden (keeps ordering with direct inserts)
+        """
+        if not force and not self.sim_log.winfo_ismapped():
+            for chunk in chunks:
+                self._sim_log_hidden.extend(chunk.splitlines(keepends=True))
             return
+        if self._sim_log_hidden:
+            chunks = [*self._sim_log_hidden, *chunks]
+            self._sim_log_hidden.clear()
+        if not chunks:
+            return
+        self.sim_log.insert(tk.END, ''.join(chunks))
+        self._trim_log(self.sim_log)
+        self.sim_log.see(tk.END)
+
+    @staticmethod
+    def _trim_log(widget):
+        """
+        Drop the oldest lines of a log Text widget once it grows past LOG_MAX_LINES.
+
+        Keeps memory bounded and inserts cheap during long Gradle builds.
+
+        Args:
+            widget: Text/ScrolledText log widget
+        """
+        num_lines = int(widget.index('end-1c').split('.')[0])
+        if num_lines > LOG_MAX_LINES:
+            widget.delete('1.0', f"{num_lines - LOG_MAX_LINES + LOG_TRIM_LINES + 1}.0")
+
+    def _robot_ended(self, proc):
+        """
+        Handle a robot code process ending (Tk thread, after it was reaped).
+
+        Args:
+            proc: The process that ended; may belong to an earlier, stopped run
+        """
+        self._live_processes.discard(proc)
+        if proc is self.robot_process:
+            # The current run's robot code exited on its own: take its bridge down too
+            self.sim_log.insert(tk.END, "\n[ROBOT] Robot code stopped\n")
+            self.robot_process = None
+            if self.simulation_process is not None:
+                self._stop_processes([self.simulation_process])
+        self._update_run_buttons()
+
+    def _simulation_ended(self, proc):
+        """
+        Handle a bridge process ending (Tk thread, after it was reaped).
+
+        Args:
+            proc: The process that ended; may belong to an earlier, stopped run
+        """
+        self._live_processes.discard(proc)
+        if proc is self.simulation_process:
+            self.simulation_process = None
+        self._update_run_buttons()
 
-        for line in self.simulation_process.stdout:
-            self.sim_log.insert(tk.END, line)
-            self.sim_log.see(tk.END)
-
-        # Process ended
-        self.root.after(0, self._simulation_ended)
-
-    def _simulation_ended(self):
-        """Handle simulation process ending."""
+    def _update_run_buttons(self):
+        """Re-enable Start once every process started so far has been reaped."""
+        if self._live_processes:
+            return
         self.start_sim_btn.config(state=tk.NORMAL)
         self.stop_sim_btn.config(state=tk.DISABLED)
         self.status_var.set("Simulation stopped")
 
+    def _stop_processes(self, processes):
+        """Stop processes and their children on a background thread (waits can take seconds)."""
+        def stop():
+            for proc in processes:
+                try:
+                    kill_process_tree(proc)
+                except Exception as e:
+                    self._sim_log_queue.put(f"[WARNING] Failed to stop process {proc.pid}: {e}\n")
+
+        threading.Thread(target=stop, daemon=True).start()
+
     def stop_simulation(self):
         """Stop the simulation."""
-        # Stop WebSocket bridge
-        if hasattr(self, 'simulation_process') and self.simulation_process:
-            self.simulation_process.terminate()
-            self.simulation_process = None
-
-        # Stop robot code
-        if hasattr(self, 'robot_process') and self.robot_process:
-            self.robot_process.terminate()
-            self.robot_process = None
+        # Stop WebSocket bridge, then robot code
+        processes = [self.simulation_process, self.robot_process]
+        self._stop_processes([proc for proc in processes if proc is not None])
+        self.simulation_process = None
+        self.robot_process = None
 
         self.sim_log.insert(tk.END, "\n\nSimulation stopped by user.\n")
-        self.status_var.set("Simulation stopped")
+        # Start is re-enabled by _update_run_buttons once both processes are reaped
+        self.stop_sim_btn.config(state=tk.DISABLED)
+        self.status_var.set("Stopping simulation...")
+        self._update_run_buttons()
 
     def open_config_folder(self):
         """Open the folder containing the config file."""
         if self.config_file_path:
-            folder = self.config_file_path.parent
-            if sys.platform == 'win32':
-                os.startfile(folder)
-            elif sys.platform == 'darwin':
-                subprocess.run(['open', folder])
-            else:
-                subprocess.run(['xdg-open', folder])
+            _open_folder(self.config_file_path.parent)
         else:
             messagebox.showinfo("No Config", "Save configuration first!")
 
     # ==================== Menu Methods ====================
 
+    def quit_app(self):
+        """Stop every process still running (bounded wait each), then close the app."""
+        for proc in list(self._live_processes):
+            try:
+                kill_process_tree(proc, timeout=2.0)
+            except Exception as e:
+                print(f"[WARNING] Failed to stop process {proc.pid}: {e}")
+        self._live_processes.clear()
+        self.root.destroy()
+
     def new_project(self):
         """Start a new project."""
         if messagebox.askyesno("New Project", "Clear all data and start new project?"):
             self.cad_files.clear()
+            self._cad_files_set.clear()
+            self._cad_abs.clear()
             self.cad_listbox.delete(0, tk.END)
             self.robot_code_path = None
             self.code_path_var.set("No robot code selected")
@@ -883,39 +1535,34 @@ class SubsystemSimApp:
 
     def show_docs(self):
         """Show documentation."""
-        doc_text = """
-SubsystemSim Documentation
-
-1. CAD IMPORT
-   - Import OBJ/STL files (meshes for your subsystem parts)
-   - For STEP files, convert to OBJ first using online tools
-   - Each mesh becomes a "link" in your mechanism
-
-2. CONFIGURATION
-   - Define joints between links (revolute, prismatic, fixed)
-   - Assign motors to joints (NEO, CIM, Falcon, etc.)
-   - Add sensors (encoders)
-   - Match HAL ports to your robot code
-
-3. ROBOT CODE
-   - Point to your Java/C++/Python robot project
-   - Code should use standard WPILib motor controllers and sensors
-
-4. SIMULATION
-   - Start simulation (launches WebSocket bridge)
-   - Run your robot code with -Phalsim flag
-   - Robot code connects and controls the physics simulation
-
-For more help, see WEBSOCKET_BRIDGE_GUIDE.md
-"""
+        self._show_text_window("docs", "Documentation", "600x500", _DOCS_TEXT)
+
+    def _show_text_window(self, key: str, title: str, geometry: str, content: str):
+        """
+        Show a read-only text window, reusing it if it is already open.
+
+        Args:
+            key: Identifies the window in _doc_windows
+            title: Window title
+            geometry: Initial size (e.g. "600x500")
+            content: Text to display
+        """
+        window = self._doc_windows.get(key)
+        if window is not None and window.winfo_exists():
+            window.deiconify()
+            window.lift()
+            return
 
         window = tk.Toplevel(self.root)
-        window.title("Documentation")
-        window.geometry("600x500")
+        window.title(title)
+        window.geometry(geometry)
+        self._doc_windows[key] = window
+        # <Destroy> also fires for child widgets; only the window itself matters
+        window.bind('<Destroy>', lambda e: self._doc_windows.pop(key, None) if e.widget is window else None)
 
         text = scrolledtext.ScrolledText(window, wrap=tk.WORD)
         text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        text.insert('1.0', doc_text)
+        text.insert('1.0', content)
         text.config(state=tk.DISABLED)
 
     def show_about(self):
@@ -950,17 +1597,19 @@ For more help, see WEBSOCKET_BRIDGE_GUIDE.md
 
             # Clear current data
             self.cad_files.clear()
+            self._cad_files_set.clear()
+            self._cad_abs.clear()
             self.cad_listbox.delete(0, tk.END)
 
             # Load mesh files
-            for mesh_file in meshes_dir.glob("*.obj"):
-                self.cad_files.append(mesh_file)
-                self.cad_listbox.insert(tk.END, f"{mesh_file.stem} (.obj)")
+            mesh_files = list(_scan_meshes(str(meshes_dir), os.stat(meshes_dir).st_mtime_ns))
+            self._cad_files_set.update(mesh_files)
+            self._add_cad_files(mesh_files)
 
             # Load config
             config_file = example_dir / "arm_config.json"
             if config_file.exists():
-                with open(config_file, 'r') as f:
+                with open(config_file, 'r', encoding='utf-8') as f:
                     self.config_data = json.load(f)
                 self.config_file_path = config_file
                 self._update_config_display()
@@ -989,121 +1638,21 @@ For more help, see WEBSOCKET_BRIDGE_GUIDE.md
 
     def show_cad_resources(self):
         """Show links to download FRC CAD resources."""
-        resources_text = """
-FRC CAD Resources - Download Links
-
-1. GRABCAD - FRC CAD Library
-   https://grabcad.com/library?query=frc
-   - Thousands of FRC robot CAD models
-   - Arms, elevators, intakes, drivetrains
-   - Filter by year (2020-2024)
-   - Download as STEP files
-
-2. Chief Delphi - CAD Resources Forum
-   https://www.chiefdelphi.com/c/technical/cad/15
-   - Community-shared designs
-   - Well-documented mechanisms
-   - STEP and SLDPRT formats
-
-3. WCP (West Coast Products) - CAD Downloads
-   https://www.wcproducts.com/
-   - Professional FRC components
-   - Greyt Elevator, Greyt Arm
-   - STEP files available
-
-4. Everybot CAD
-   https://www.robowranglers148.com/uploads/1/0/5/4/10542658/2024_everybot_cad.zip
-   - Simple, well-documented arm
-   - Perfect for testing
-   - SLDASM format (can export STEP)
-
-5. Online STEP to OBJ Converter
-   https://convert3d.org/step-to-obj
-   - Convert STEP → OBJ for SubsystemSim
-   - Free, no account needed
-
-INSTRUCTIONS:
-1. Download STEP file from any source above
-2. Convert to OBJ using online converter
-3. Import OBJ files in SubsystemSim CAD Import tab
-4. Auto-generate configuration
-5. Test with simulation!
-"""
-
-        window = tk.Toplevel(self.root)
-        window.title("FRC CAD Resources")
-        window.geometry("700x600")
-
-        text = scrolledtext.ScrolledText(window, wrap=tk.WORD)
-        text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        text.insert('1.0', resources_text)
-        text.config(state=tk.DISABLED)
+        self._show_text_window("cad_resources", "FRC CAD Resources", "700x600", _CAD_RESOURCES_TEXT)
 
     def show_java_examples(self):
         """Show links to download Java robot code examples."""
-        examples_text = """
-Java Robot Code Examples - Download Links
-
-1. WPILib Example Projects (OFFICIAL)
-   https://github.com/wpilibsuite/allwpilib/tree/main/wpilibjExamples
-   - Official WPILib Java examples
-   - Motor control, encoders, PID
-   - Clone with: git clone https://github.com/wpilibsuite/allwpilib.git
-   - Examples in: wpilibjExamples/src/main/java/edu/wpi/first/wpilibj/examples/
-
-2. Simple Arm Example (Recommended for Testing)
-   https://github.com/wpilibsuite/allwpilib/tree/main/wpilibjExamples/src/main/java/edu/wpi/first/wpilibj/examples/armbot
-   - Single-joint arm with PID control
-   - Uses PWM motor and encoder
-   - Perfect match for simple arm CAD
-
-3. Elevator Example
-   https://github.com/wpilibsuite/allwpilib/tree/main/wpilibjExamples/src/main/java/edu/wpi/first/wpilibj/examples/elevatorbot
-   - Vertical motion (prismatic joint)
-   - Trapezoidal motion profiling
-
-4. FRC 2024 Robot Code Examples (Chief Delphi)
-   https://www.chiefdelphi.com/t/2024-robot-code-repositories/450816
-   - Real team code from 2024 season
-   - Production-quality examples
-   - Various subsystem designs
-
-5. Create New Java Robot Project
-   Run in terminal:
-   > wpilib create project
-   - Creates new Java robot project
-   - Includes Gradle build files
-   - Ready for simulation
-
-QUICK START FOR TESTING:
-1. Download ArmBot example from link #2
-2. Extract to a folder
-3. In SubsystemSim, go to "Robot Code" tab
-4. Browse to the extracted folder
-5. In terminal: gradlew simulateJava -Phalsim
-6. Robot code connects to SubsystemSim!
-
-PORT MAPPING:
-Make sure robot code motor/sensor ports match your SubsystemSim config:
-- Motor: PWMSparkMax(PORT) → config: "hal_port": PORT
-- Encoder: Encoder(PORT_A, PORT_B) → config: "hal_ports": [PORT_A, PORT_B]
-"""
-
-        window = tk.Toplevel(self.root)
-        window.title("Java Robot Code Examples")
-        window.geometry("800x650")
-
-        text = scrolledtext.ScrolledText(window, wrap=tk.WORD)
-        text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        text.insert('1.0', examples_text)
-        text.config(state=tk.DISABLED)
+        self._show_text_window("java_examples", "Java Robot Code Examples", "800x650", _JAVA_EXAMPLES_TEXT)
 
 
 def main():
     """Entry point for GUI application."""
     root = tk.Tk()
     app = SubsystemSimApp(root)
-    root.mainloop()
+    try:
+        root.mainloop()
+    except KeyboardInterrupt:
+        app.quit_app()
 
 
 if __name__ == "__main__":
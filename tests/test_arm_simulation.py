@@ -14,6 +14,8 @@ import time
 import math
 from pathlib import Path
 
+import numpy as np
+
 # Get project root and add to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
@@ -23,6 +25,9 @@ from subsystemsim.physics.urdf_generator import generate_urdf
 from subsystemsim.physics.engine import PhysicsEngine
 from subsystemsim.physics.actuators import DCMotor
 
+_RAD2DEG = 180 / math.pi
+_RADPS2RPM = 60 / (2 * math.pi)
+
 
 def main():
     print("=== Arm Simulation Test (Day 4) ===\n")
@@ -61,35 +66,47 @@ def main():
     print("   The arm will rotate back and forth.\n")
     print("   Press Ctrl+C to stop\n")
 
+    # Desired voltage (sinusoidal for demo), oscillating between -6V and +6V.
+    # One period sampled per physics step, looked up instead of calling sin()
+    num_samples = int(2 * math.pi / (0.5 * engine.TIMESTEP)) + 1
+    voltages = (6.0 * np.sin(0.5 * engine.TIMESTEP * np.arange(num_samples))).tolist()
+
     try:
         step_count = 0
         simulation_time = 0.0
+        TIMESTEP = engine.TIMESTEP
+        next_t = time.monotonic() + TIMESTEP  # Real-time pacing deadline
+        shoulder = engine.get_joint_handle("arm", "shoulder")  # Resolve names once
+        log_countdown = 120  # Steps until the next status line
 
         while True:
-            # Calculate desired voltage (sinusoidal for demo)
-            # Oscillate between -6V and +6V
-            voltage = 6.0 * math.sin(simulation_time * 0.5)
+            voltage = voltages[step_count % num_samples]
 
             # Get current joint state
-            position, velocity = engine.get_joint_state("arm", "shoulder")
+            position, velocity = engine.get_handle_state(shoulder)
 
             # Calculate torque from motor model
             torque = motor.calculate_torque(voltage, velocity, gear_ratio)
 
             # Apply torque to joint
-            engine.apply_joint_torque("arm", "shoulder", torque)
+            engine.apply_handle_torque(shoulder, torque)
 
             # Step physics
             engine.step()
-            time.sleep(engine.TIMESTEP)
+            slack = next_t - time.monotonic()
+            if slack > 0:
+                time.sleep(slack)
+            next_t += TIMESTEP
 
             # Print status every 0.5 seconds
             step_count += 1
-            simulation_time += engine.TIMESTEP
+            simulation_time += TIMESTEP
 
-            if step_count % 120 == 0:  # 120 steps ~ 0.5s
-                position_deg = position * 180 / math.pi
-                velocity_rpm = velocity * 60 / (2 * math.pi)
+            log_countdown -= 1
+            if not log_countdown:  # 120 steps ~ 0.5s
+                log_countdown = 120
+                position_deg = position * _RAD2DEG
+                velocity_rpm = velocity * _RADPS2RPM
                 print(f"t={simulation_time:5.2f}s: "
                       f"V={voltage:5.2f}V, "
                       f"pos={position_deg:6.1f}deg, "
@@ -14,14 +14,17 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from subsystemsim.core.config import load_config
+from subsystemsim.physics.urdf_generator import generate_urdf
 from subsystemsim.physics.engine import PhysicsEngine
 import pybullet as p
 
 # Initialize engine
 engine = PhysicsEngine(gui=True)
 
-# Load arm URDF
-urdf_path = str(project_root / "generated_urdfs/simple_arm.urdf")
+# Load arm URDF (generate_urdf reuses the existing file if the model is unchanged)
+model = load_config(project_root / "examples/simple_arm/arm_config.json")
+urdf_path = generate_urdf(model, output_dir=str(project_root / "generated_urdfs"))
 body_id = engine.load_urdf(urdf_path, name="arm")
 
 print("\n=== Joint Movement Test with Angle Wrapping ===")
@@ -30,18 +33,27 @@ print("Position wraps to (-180deg, 180deg] range for continuous rotation.\n")
 
 try:
     step = 0
+    TIMESTEP = engine.TIMESTEP
+    next_t = time.monotonic() + TIMESTEP  # Real-time pacing deadline
+    shoulder = engine.get_joint_handle("arm", "shoulder")  # Resolve names once
+    log_countdown = 120  # Steps until the next status line
     while True:
         # Apply constant torque
-        engine.apply_joint_torque("arm", "shoulder", 1.0)
+        engine.apply_handle_torque(shoulder, 1.0)
 
         # Step simulation
         engine.step()
-        time.sleep(engine.TIMESTEP)
+        slack = next_t - time.monotonic()
+        if slack > 0:
+            time.sleep(slack)
+        next_t += TIMESTEP
 
         # Print status every 0.5 seconds
         step += 1
-        if step % 120 == 0:
-            pos, vel = engine.get_joint_state("arm", "shoulder")
+        log_countdown -= 1
+        if not log_countdown:
+            log_countdown = 120
+            pos, vel = engine.get_handle_state(shoulder)
             time_s = step / 240.0
             print(f"t={time_s:5.2f}s: pos={pos:7.3f} rad ({pos*57.3:7.1f}deg), vel={vel:6.3f} rad/s")
 
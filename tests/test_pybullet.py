@@ -14,6 +14,30 @@ sys.path.insert(0, str(project_root))
 
 from subsystemsim.physics.engine import PhysicsEngine
 
+# Shape indices by (create function, geometry, parameters). PyBullet keeps shapes around,
+# so identical objects can share one instead of creating and uploading another.
+_SHAPES = {}
+
+
+def _cached_shape(create, geom_type, **kwargs):
+    """
+    Create a collision/visual shape once per distinct set of parameters.
+
+    Args:
+        create: The engine client's createCollisionShape or createVisualShape
+        geom_type: PyBullet geometry type (client.GEOM_BOX, ...)
+        **kwargs: Shape parameters (lists allowed)
+
+    Returns:
+        Shape index
+    """
+    key = (create, geom_type,
+           tuple(sorted((k, tuple(v) if isinstance(v, list) else v) for k, v in kwargs.items())))
+    shape = _SHAPES.get(key)
+    if shape is None:
+        shape = _SHAPES[key] = create(geom_type, **kwargs)
+    return shape
+
 
 def main():
     print("=== PyBullet Test ===")
@@ -25,16 +49,22 @@ def main():
 
     # Create a simple cube mesh using PyBullet primitives
     # (Later we'll load actual OBJ files from CAD)
-    import pybullet as p
+    # Raw PyBullet calls go through the engine's client so they reach its server
+    client = engine.client
+    # BulletClient returns a new bound method on every lookup; bind once so the
+    # shape cache keys on the same callable
+    create_collision_shape = client.createCollisionShape
+    create_visual_shape = client.createVisualShape
 
     # Create a red cube
-    collision_shape = p.createCollisionShape(p.GEOM_BOX, halfExtents=[0.1, 0.1, 0.1])
-    visual_shape = p.createVisualShape(
-        p.GEOM_BOX,
+    collision_shape = _cached_shape(create_collision_shape, client.GEOM_BOX, halfExtents=[0.1, 0.1, 0.1])
+    visual_shape = _cached_shape(
+        create_visual_shape,
+        client.GEOM_BOX,
         halfExtents=[0.1, 0.1, 0.1],
         rgbaColor=[1, 0, 0, 1]  # Red
     )
-    cube_id = p.createMultiBody(
+    cube_id = client.createMultiBody(
         baseMass=1.0,
         baseCollisionShapeIndex=collision_shape,
         baseVisualShapeIndex=visual_shape,
@@ -42,13 +72,14 @@ def main():
     )
 
     # Create a green sphere
-    collision_sphere = p.createCollisionShape(p.GEOM_SPHERE, radius=0.1)
-    visual_sphere = p.createVisualShape(
-        p.GEOM_SPHERE,
+    collision_sphere = _cached_shape(create_collision_shape, client.GEOM_SPHERE, radius=0.1)
+    visual_sphere = _cached_shape(
+        create_visual_shape,
+        client.GEOM_SPHERE,
         radius=0.1,
         rgbaColor=[0, 1, 0, 1]  # Green
     )
-    sphere_id = p.createMultiBody(
+    sphere_id = client.createMultiBody(
         baseMass=0.5,
         baseCollisionShapeIndex=collision_sphere,
         baseVisualShapeIndex=visual_sphere,
@@ -63,15 +94,20 @@ def main():
     # Run simulation loop
     try:
         step_count = 0
+        TIMESTEP = engine.TIMESTEP
+        next_t = time.monotonic() + TIMESTEP  # Real-time pacing deadline
         while True:
             engine.step()
-            time.sleep(engine.TIMESTEP)
+            slack = next_t - time.monotonic()
+            if slack > 0:
+                time.sleep(slack)
+            next_t += TIMESTEP
 
             # Print position every 60 steps (~0.25s)
             step_count += 1
             if step_count % 60 == 0:
-                cube_pos, _ = p.getBasePositionAndOrientation(cube_id)
-                sphere_pos, _ = p.getBasePositionAndOrientation(sphere_id)
+                cube_pos, _ = client.getBasePositionAndOrientation(cube_id)
+                sphere_pos, _ = client.getBasePositionAndOrientation(sphere_id)
                 print(f"t={step_count * engine.TIMESTEP:.2f}s: "
                       f"cube_z={cube_pos[2]:.3f}m, sphere_z={sphere_pos[2]:.3f}m")
 
@@ -0,0 +1,73 @@
+"""
+run_steps test: headless stepping after a fused step().
+
+step(n) with fuse_substeps=True reconfigures PyBullet to one n * TIMESTEP step
+split into n substeps. run_steps() must still advance TIMESTEP per step, so
+after the same inputs a fused engine has to match a plain one.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from subsystemsim.core.config import load_config
+from subsystemsim.physics.urdf_generator import generate_urdf
+from subsystemsim.physics.engine import PhysicsEngine
+
+FUSED_STEPS = 4
+HELD_STEPS = 120
+TORQUE = 1.0  # Nm on the shoulder
+
+
+def _run(urdf_path: str, body_name: str, fuse_substeps: bool):
+    """
+    Step the arm once by FUSED_STEPS, then hold a torque with run_steps().
+
+    Args:
+        urdf_path: URDF to load
+        body_name: Name to load the body under
+        fuse_substeps: Passed to PhysicsEngine
+
+    Returns:
+        (positions, velocities, sub_steps) after run_steps()
+    """
+    engine = PhysicsEngine(gui=False, fuse_substeps=fuse_substeps)
+    try:
+        engine.load_urdf(urdf_path, name=body_name)
+        shoulder = engine.get_joint_handle(body_name, "shoulder")
+        engine.step(FUSED_STEPS)
+        positions, velocities = engine.run_steps(body_name, HELD_STEPS,
+                                                 [shoulder.joint_index], [TORQUE])
+        return positions, velocities, engine._sub_steps
+    finally:
+        engine.disconnect()
+
+
+def test_run_steps_after_fused_step():
+    """run_steps() after a fused step() matches an engine that never fused."""
+    model = load_config(project_root / "examples/simple_arm/arm_config.json")
+    urdf_path = generate_urdf(model, output_dir=str(project_root / "generated_urdfs"))
+
+    fused_pos, fused_vel, sub_steps = _run(urdf_path, model.name, fuse_substeps=True)
+    plain_pos, plain_vel, _ = _run(urdf_path, model.name, fuse_substeps=False)
+
+    if sub_steps != 1:
+        print(f"[FAILED] run_steps() left numSubSteps at {sub_steps}")
+        return False
+    if not (np.allclose(fused_pos, plain_pos, atol=1e-5)
+            and np.allclose(fused_vel, plain_vel, atol=1e-5)):
+        print(f"[FAILED] Fused engine diverged: {fused_pos} vs {plain_pos}")
+        return False
+
+    print("[OK] run_steps() advances TIMESTEP per step after a fused step()")
+    return True
+
+
+if __name__ == "__main__":
+    success = test_run_steps_after_fused_step()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,99 @@
+"""
+URDF cache test: generate_urdf() reuse and failed writes.
+
+Checks that:
+- An unchanged model reuses the cached URDF, which still loads in DIRECT mode
+- A write that fails partway leaves no hash behind, so the next call regenerates
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from subsystemsim.core.config import load_config
+from subsystemsim.physics import urdf_generator
+from subsystemsim.physics.urdf_generator import generate_urdf
+from subsystemsim.physics.engine import PhysicsEngine
+
+CONFIG_PATH = project_root / "examples/simple_arm/arm_config.json"
+
+
+def test_cache_hit():
+    """Generating the same model twice reuses the first URDF."""
+    model = load_config(CONFIG_PATH)
+    with tempfile.TemporaryDirectory() as output_dir:
+        urdf_path = Path(generate_urdf(model, output_dir=output_dir))
+        first_mtime = urdf_path.stat().st_mtime_ns
+
+        if Path(generate_urdf(model, output_dir=output_dir)) != urdf_path:
+            print("[FAILED] Cached URDF path changed")
+            return False
+        if urdf_path.stat().st_mtime_ns != first_mtime:
+            print("[FAILED] Unchanged model rewrote the URDF")
+            return False
+
+        engine = PhysicsEngine(gui=False)
+        try:
+            engine.load_urdf(str(urdf_path), name=model.name)
+        finally:
+            engine.disconnect()
+
+    print("[OK] Unchanged model reused the cached URDF")
+    return True
+
+
+def test_failed_write():
+    """A write that raises must not leave a URDF that a later call reuses."""
+    model = load_config(CONFIG_PATH)
+    with tempfile.TemporaryDirectory() as output_dir:
+        urdf_path = Path(generate_urdf(model, output_dir=output_dir))
+        hash_path = urdf_path.with_name(urdf_path.name + ".hash")
+        good_urdf = urdf_path.read_text()
+
+        # Change the model so the cache misses, then fail halfway through the joints
+        model.joints[0].effort_limit += 1.0
+        original_joint_xml = urdf_generator._joint_xml
+
+        def failing_joint_xml(*args, **kwargs):
+            raise RuntimeError("simulated write failure")
+
+        urdf_generator._joint_xml = failing_joint_xml
+        try:
+            generate_urdf(model, output_dir=output_dir)
+            print("[FAILED] Expected the simulated write failure to propagate")
+            return False
+        except RuntimeError:
+            pass
+        finally:
+            urdf_generator._joint_xml = original_joint_xml
+
+        if hash_path.exists():
+            print("[FAILED] Hash sidecar survived a failed write")
+            return False
+        if urdf_path.read_text() != good_urdf:
+            print("[FAILED] Failed write truncated the existing URDF")
+            return False
+
+        # The next call must regenerate rather than reuse
+        generate_urdf(model, output_dir=output_dir)
+        if not hash_path.exists() or urdf_path.read_text() == good_urdf:
+            print("[FAILED] URDF was not regenerated after the failed write")
+            return False
+
+        engine = PhysicsEngine(gui=False)
+        try:
+            engine.load_urdf(str(urdf_path), name=model.name)
+        finally:
+            engine.disconnect()
+
+    print("[OK] Failed write left no reusable URDF")
+    return True
+
+
+if __name__ == "__main__":
+    results = [test_cache_hit(), test_failed_write()]
+    sys.exit(0 if all(results) else 1)